@@ -8,14 +8,19 @@ and outputs a single standalone HTML file.
 Unit of analysis: WEEKS (players take turns betting each week).
 """
 
-import csv
+import gzip
+import http.client
 import io
 import json
 import os
 import random
+import time
+import urllib.error
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 
 
@@ -68,6 +73,8 @@ PLAYER_COLORS = {
 
 PLAYER_ORDER = ["Bjørn", "Nikolaj", "Nixon", "Jonas", "Gustav"]
 
+OTHER_PLAYERS = {p: [o for o in PLAYER_ORDER if o != p] for p in PLAYER_ORDER}
+
 DANISH_MONTHS = [
     "Jan", "Feb", "Mar", "Apr", "Maj", "Jun",
     "Jul", "Aug", "Sep", "Okt", "Nov", "Dec",
@@ -75,23 +82,120 @@ DANISH_MONTHS = [
 
 DANISH_WEEKDAYS = ["Man", "Tir", "Ons", "Tor", "Fre", "Lør", "Søn"]
 
+# Sheet columns the report reads; everything else is dropped after loading
+BET_COLUMNS = ["Dato", "Spiller", "Liga", "Indsats", "Odds", "Profit"]
+
+# Parsed sheet data is reused between runs for CACHE_TTL seconds; set
+# TIPSKLUB_CACHE_TTL to change that, or to 0 to always download afresh
+CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "tipsklub"
+)
+CACHE_TTL = int(os.environ.get("TIPSKLUB_CACHE_TTL", "3600"))
+CACHE_VERSION = 2  # bump when parse_sheet changes the cached frame's columns
+
 
 # ── 1. Data Fetching & Parsing ──────────────────────────────────────────────
 
 def fetch_data() -> pd.DataFrame:
-    """Fetch CSV from Google Sheets and parse into DataFrame."""
+    """Fetch CSV from Google Sheets and parse into DataFrame.
+
+    The parsed frame is cached in CACHE_DIR, so runs within CACHE_TTL
+    seconds of the last download skip both the request and the parsing.
+    With CACHE_TTL set to 0 the cached frame is not read at all.
+    """
+    cache_path = os.path.join(CACHE_DIR, f"bets-v{CACHE_VERSION}.pkl")
+    cached, age = load_cached_bets(cache_path) if CACHE_TTL > 0 else (None, 0.0)
+    if cached is not None and age < CACHE_TTL:
+        print(f"Using cached sheet data ({age / 60:.0f} min old)")
+        df = cached
+    else:
+        df = download_sheet(cache_path, cached)
+
+    print(f"  2025 rows: {len(df)}")
+    print(f"  Players: {sorted(df['Spiller'].unique())}")
+    return df
+
+
+def load_cached_bets(cache_path: str) -> tuple[pd.DataFrame | None, float]:
+    """Return the cached bets frame and its age in seconds, if there is one.
+
+    The pickle is trusted, local-only data written by download_sheet; it is
+    never fetched from elsewhere. A file that fails to load is deleted and
+    treated as a cache miss, so the sheet is downloaded again.
+    """
+    try:
+        age = time.time() - os.path.getmtime(cache_path)
+    except OSError:
+        return None, 0.0
+    try:
+        return pd.read_pickle(cache_path), age
+    except Exception as e:
+        print(f"  Warning: Discarding unreadable cache {cache_path}: {e}")
+        try:
+            os.remove(cache_path)
+        except OSError:
+            pass
+        return None, 0.0
+
+
+def download_sheet(cache_path: str, cached: pd.DataFrame | None) -> pd.DataFrame:
+    """Download and parse the sheet, revalidating any stale cached frame.
+
+    The stored ETag/Last-Modified are sent along, and the cached frame is
+    reused when the sheet is unchanged (304) or cannot be fetched at all.
+    """
+    meta_path = os.path.join(CACHE_DIR, f"bets-v{CACHE_VERSION}.meta.json")
+    headers = {"User-Agent": "Mozilla/5.0"}
+    if cached is not None:
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+        except Exception:
+            meta = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
     print("Fetching data from Google Sheets...")
-    req = urllib.request.Request(SHEET_URL, headers={"User-Agent": "Mozilla/5.0"})
-    with urllib.request.urlopen(req, timeout=30) as resp:
-        raw = resp.read().decode("utf-8")
+    req = urllib.request.Request(SHEET_URL, headers=headers)
+    try:
+        with urllib.request.urlopen(req, timeout=30) as resp:
+            raw = resp.read().decode("utf-8")
+            meta = {
+                "etag": resp.headers.get("ETag"),
+                "last_modified": resp.headers.get("Last-Modified"),
+            }
+    except (OSError, http.client.HTTPException) as e:
+        if cached is None:
+            raise
+        if isinstance(e, urllib.error.HTTPError) and e.code == 304:
+            print("  Sheet unchanged, using cached data")
+            try:
+                os.utime(cache_path)
+            except OSError as err:
+                print(f"  Warning: Failed to refresh cache timestamp: {err}")
+        else:
+            print(f"  Warning: Failed to fetch sheet, using cached data: {e}")
+        return cached
+
+    df = parse_sheet(raw)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        df.to_pickle(cache_path)
+        with open(meta_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+    except Exception as e:
+        print(f"  Warning: Failed to cache sheet data: {e}")
+    return df
 
-    reader = csv.reader(io.StringIO(raw))
-    rows = list(reader)
-    header = rows[0]
-    data = rows[1:]
 
-    df = pd.DataFrame(data, columns=header)
-    df.columns = df.columns.str.strip()
+def parse_sheet(raw: str) -> pd.DataFrame:
+    """Parse the exported sheet CSV into the filtered 2025 bets frame."""
+    # Read the header as a data row so blank or repeated column names stay as-is
+    df = pd.read_csv(io.StringIO(raw), header=None, dtype=str, keep_default_na=False)
+    df.columns = df.iloc[0].str.strip().tolist()
+    df = df.iloc[1:]
     df = df.loc[:, df.columns != ""]
     df = df.dropna(how="all").reset_index(drop=True)
     df = df[df.iloc[:, 0].astype(str).str.strip() != ""].reset_index(drop=True)
@@ -99,40 +203,36 @@ def fetch_data() -> pd.DataFrame:
     print(f"  Columns: {list(df.columns)}")
     print(f"  Total rows: {len(df)}")
 
-    for col in ["Indsats", "Gik Hjem", "Odds", "Gevinst", "Profit"]:
+    df = df[[c for c in BET_COLUMNS if c in df.columns]]
+    for col in ["Indsats", "Odds", "Profit"]:
         if col in df.columns:
-            df[col] = df[col].apply(parse_danish_number)
+            df[col] = parse_danish_numbers(df[col])
 
     if "Dato" in df.columns:
         df["Dato"] = pd.to_datetime(df["Dato"], format="%d/%m/%Y", errors="coerce")
 
-    df = df[(df["Dato"] >= "2025-04-29") & (df["Dato"] <= "2026-01-25")].copy()
+    df = df[(df["Dato"] >= "2025-04-29") & (df["Dato"] <= "2026-01-25")]
     df = df.sort_values("Dato").reset_index(drop=True)
 
-    print(f"  2025 rows: {len(df)}")
-    print(f"  Players: {sorted(df['Spiller'].unique())}")
+    # Calendar keys shared by the weekly aggregation, stats and charts
+    df["WeekKey"] = df["Dato"].dt.strftime("%G-W%V")
+    df["Weekday"] = df["Dato"].dt.dayofweek
     return df
 
 
-def parse_danish_number(s: str) -> float:
-    if not isinstance(s, str) or s.strip() == "":
-        return 0.0
-    s = s.strip().replace(" ", "").replace("kr", "")
-    s = s.replace(".", "").replace(",", ".")
-    try:
-        return float(s)
-    except ValueError:
-        return 0.0
+def parse_danish_numbers(s: pd.Series) -> pd.Series:
+    """Parse Danish amounts like "1.234,50 kr"; blank or invalid cells become 0."""
+    cleaned = (
+        s.astype("string")
+        .str.replace(r"\s+|kr", "", regex=True)
+        .str.replace(".", "", regex=False)
+        .str.replace(",", ".", regex=False)
+    )
+    return pd.to_numeric(cleaned, errors="coerce").fillna(0.0).astype(float)
 
 
 def aggregate_weekly(df: pd.DataFrame) -> pd.DataFrame:
     """Aggregate individual bets into weekly results per player."""
-    iso = df["Dato"].dt.isocalendar()
-    df = df.copy()
-    df["ISOWeek"] = iso["week"].astype(int)
-    df["ISOYear"] = iso["year"].astype(int)
-    df["WeekKey"] = df["ISOYear"].astype(str) + "-W" + df["ISOWeek"].astype(str).str.zfill(2)
-
     weekly = df.groupby(["WeekKey", "Spiller"]).agg(
         Bets=("Profit", "count"),
         Profit=("Profit", "sum"),
@@ -150,37 +250,45 @@ def aggregate_weekly(df: pd.DataFrame) -> pd.DataFrame:
 # ── 2. Stats Computation ────────────────────────────────────────────────────
 
 def compute_player_stats(weekly: pd.DataFrame, df_bets: pd.DataFrame) -> pd.DataFrame:
-    stats = []
-    for player in PLAYER_ORDER:
-        pw = weekly[weekly["Spiller"] == player].copy()
-        pb = df_bets[df_bets["Spiller"] == player].copy()
-        if pw.empty:
-            continue
-        winning = pw[pw["Profit"] > 0]
-        losing = pw[pw["Profit"] < 0]
-        win_streak, loss_streak = compute_streaks(pw)
-        stats.append({
-            "Spiller": player,
-            "Weeks": len(pw),
-            "Bets": len(pb),
-            "Winning Weeks": len(winning),
-            "Losing Weeks": len(losing),
-            "Win Rate": len(winning) / len(pw) * 100,
-            "Total Staked": pw["Staked"].sum(),
-            "Total Profit": pw["Profit"].sum(),
-            "ROI": pw["Profit"].sum() / pw["Staked"].sum() * 100,
-            "Avg Odds": pb["Odds"].mean(),
-            "Best Week": pw["Profit"].max(),
-            "Worst Week": pw["Profit"].min(),
-            "Win Streak": win_streak,
-            "Loss Streak": loss_streak,
-        })
-    return pd.DataFrame(stats)
+    profit = weekly["Profit"]
+    week_groups = weekly.groupby("Spiller", sort=False)
+    per_week = weekly.assign(Won=profit > 0, Lost=profit < 0).groupby("Spiller").agg(
+        Weeks=("Profit", "size"),
+        Winning=("Won", "sum"),
+        Losing=("Lost", "sum"),
+        Staked=("Staked", "sum"),
+        Profit=("Profit", "sum"),
+        Best=("Profit", "max"),
+        Worst=("Profit", "min"),
+    )
+    per_bet = df_bets.groupby("Spiller").agg(Bets=("Odds", "size"), AvgOdds=("Odds", "mean"))
+
+    players = [p for p in PLAYER_ORDER if p in per_week.index]
+    per_week = per_week.loc[players]
+    per_bet = per_bet.reindex(players)
+    profit_values = profit.to_numpy()
+    streaks = [compute_streaks(profit_values[week_groups.indices[p]]) for p in players]
+    return pd.DataFrame({
+        "Spiller": players,
+        "Weeks": per_week["Weeks"].to_numpy(),
+        "Bets": per_bet["Bets"].fillna(0).astype(int).to_numpy(),
+        "Winning Weeks": per_week["Winning"].to_numpy(),
+        "Losing Weeks": per_week["Losing"].to_numpy(),
+        "Win Rate": (per_week["Winning"] / per_week["Weeks"] * 100).to_numpy(),
+        "Total Staked": per_week["Staked"].to_numpy(),
+        "Total Profit": per_week["Profit"].to_numpy(),
+        "ROI": (per_week["Profit"] / per_week["Staked"] * 100).to_numpy(),
+        "Avg Odds": per_bet["AvgOdds"].to_numpy(),
+        "Best Week": per_week["Best"].to_numpy(),
+        "Worst Week": per_week["Worst"].to_numpy(),
+        "Win Streak": [w for w, _ in streaks],
+        "Loss Streak": [l for _, l in streaks],
+    })
 
 
-def compute_streaks(pw: pd.DataFrame) -> tuple[int, int]:
+def compute_streaks(profits: np.ndarray) -> tuple[int, int]:
     max_win = max_loss = cur_win = cur_loss = 0
-    for p in pw["Profit"]:
+    for p in profits.tolist():
         if p > 0:
             cur_win += 1
             cur_loss = 0
@@ -194,20 +302,81 @@ def compute_streaks(pw: pd.DataFrame) -> tuple[int, int]:
     return max_win, max_loss
 
 
+def compute_bet_metrics(df_bets: pd.DataFrame) -> pd.DataFrame:
+    """Per-player bet-level figures shared by the charts and the quiz."""
+    by_player = df_bets["Spiller"]
+    high_odds = (df_bets["Odds"] >= 3).groupby(by_player).sum()
+
+    # Last bet of each player's week
+    last_bets = df_bets.sort_values("Dato").groupby(["WeekKey", "Spiller"]).tail(1)
+    closer = (last_bets["Profit"] > 0).groupby(last_bets["Spiller"]).agg(["sum", "size"])
+
+    # Highest-odds winning bet (first one on ties)
+    winners = df_bets[df_bets["Profit"] > 0]
+    longshots = winners.loc[winners.groupby("Spiller")["Odds"].idxmax()].set_index("Spiller")
+
+    metrics = pd.DataFrame({
+        "High Odds Bets": high_odds,
+        "Closer Wins": closer["sum"],
+        "Closer Weeks": closer["size"],
+        "Best Win Odds": longshots["Odds"],
+        "Best Win Profit": longshots["Profit"],
+    }).reindex(PLAYER_ORDER).fillna(0)
+    return metrics.astype({"High Odds Bets": int, "Closer Wins": int, "Closer Weeks": int})
+
+
+def compute_league_stats(df_bets: pd.DataFrame) -> pd.DataFrame:
+    """Bet count and profit per league; bets spanning several leagues count for each."""
+    # Explode only the league column; the exploded index points back at the bet rows
+    leagues = df_bets["Liga"].fillna("").astype(str).str.split(",").explode().str.strip()
+    leagues = leagues[leagues != ""]
+    profit = df_bets["Profit"].loc[leagues.index]
+    return profit.groupby(leagues.to_numpy()).agg(
+        Bets="count",
+        Profit="sum",
+    ).rename_axis("Liga")
+
+
+def compute_picks(stats: pd.DataFrame, weekly: pd.DataFrame) -> dict[str, pd.Series]:
+    """Rows holding the extreme values shared by the award cards and the quiz."""
+    return {
+        "profit_max": stats.loc[stats["Total Profit"].idxmax()],
+        "profit_min": stats.loc[stats["Total Profit"].idxmin()],
+        "streak_max": stats.loc[stats["Win Streak"].idxmax()],
+        "odds_max": stats.loc[stats["Avg Odds"].idxmax()],
+        "odds_min": stats.loc[stats["Avg Odds"].idxmin()],
+        "roi_max": stats.loc[stats["ROI"].idxmax()],
+        "bets_max": stats.loc[stats["Bets"].idxmax()],
+        "week_max": weekly.loc[weekly["Profit"].idxmax()],
+        "week_min": weekly.loc[weekly["Profit"].idxmin()],
+    }
+
+
 # ── 3. Chart Data (JSON for Chart.js) ──────────────────────────────────────
 
+def to_json(obj) -> str:
+    """Compact JSON for payloads embedded in the generated pages."""
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def to_kr(values: pd.Series) -> list[int]:
+    """Whole-krone amounts, which is all the charts display."""
+    return values.round(0).astype(int).tolist()
+
+
 def chart1_cumulative_data(weekly: pd.DataFrame) -> str:
     """Cumulative P/L over time — line chart data."""
+    by_player = weekly.sort_values("FirstDate", kind="stable").groupby("Spiller", sort=False)
     datasets = []
     for player in PLAYER_ORDER:
-        pw = weekly[weekly["Spiller"] == player].sort_values("FirstDate")
-        if pw.empty:
+        if player not in by_player.groups:
             continue
-        cum = pw["Profit"].cumsum()
+        pw = by_player.get_group(player)
+        xs = pw["FirstDate"].dt.strftime("%Y-%m-%d").tolist()
+        ys = to_kr(pw["Profit"].cumsum())
         datasets.append({
             "label": player,
-            "data": [{"x": d.strftime("%Y-%m-%d"), "y": round(v, 0)}
-                     for d, v in zip(pw["FirstDate"], cum)],
+            "data": [{"x": x, "y": y} for x, y in zip(xs, ys)],
             "borderColor": PLAYER_COLORS[player],
             "backgroundColor": PLAYER_COLORS[player],
             "borderWidth": 3,
@@ -216,15 +385,15 @@ def chart1_cumulative_data(weekly: pd.DataFrame) -> str:
             "tension": 0.15,
             "fill": False,
         })
-    return json.dumps(datasets)
+    return to_json(datasets)
 
 
 def chart2_leaderboard_data(stats: pd.DataFrame) -> str:
     """Leaderboard — horizontal bar data."""
     sorted_stats = stats.sort_values("Total Profit", ascending=True)
-    return json.dumps({
+    return to_json({
         "labels": sorted_stats["Spiller"].tolist(),
-        "data": [round(v, 0) for v in sorted_stats["Total Profit"]],
+        "data": to_kr(sorted_stats["Total Profit"]),
         "colors": [PLAYER_COLORS[p] for p in sorted_stats["Spiller"]],
     })
 
@@ -232,9 +401,9 @@ def chart2_leaderboard_data(stats: pd.DataFrame) -> str:
 def chart3_winrate_data(stats: pd.DataFrame) -> str:
     """Win rate — bar chart data."""
     sorted_stats = stats.sort_values("Win Rate", ascending=False)
-    return json.dumps({
+    return to_json({
         "labels": sorted_stats["Spiller"].tolist(),
-        "data": [round(v, 1) for v in sorted_stats["Win Rate"]],
+        "data": sorted_stats["Win Rate"].round(1).tolist(),
         "colors": [PLAYER_COLORS[p] for p in sorted_stats["Spiller"]],
         "weeks": sorted_stats["Weeks"].tolist(),
         "winning": sorted_stats["Winning Weeks"].tolist(),
@@ -246,115 +415,106 @@ def chart4_monthly_data(weekly: pd.DataFrame) -> str:
     months_with_data = sorted(weekly["Month"].unique())
     labels = [DANISH_MONTHS[m - 1] for m in months_with_data]
 
+    monthly = weekly.groupby(["Spiller", "Month"])["Profit"].sum().unstack(fill_value=0.0)
+    monthly = monthly.reindex(index=PLAYER_ORDER, columns=months_with_data, fill_value=0.0)
     datasets = []
     for player in PLAYER_ORDER:
-        pw = weekly[weekly["Spiller"] == player]
-        monthly = pw.groupby("Month")["Profit"].sum()
-        vals = [round(monthly.get(m, 0.0), 0) for m in months_with_data]
         datasets.append({
             "label": player,
-            "data": vals,
+            "data": to_kr(monthly.loc[player]),
             "backgroundColor": PLAYER_COLORS[player],
         })
-    return json.dumps({"labels": labels, "datasets": datasets})
+    return to_json({"labels": labels, "datasets": datasets})
 
 
-def chart5_league_data(df_bets: pd.DataFrame) -> str:
+def chart5_league_data(league_stats: pd.DataFrame) -> str:
     """Bets by league — horizontal bar."""
-    df_leagues = df_bets.copy()
-    df_leagues["Liga"] = df_leagues["Liga"].fillna("").astype(str)
-    df_leagues["Liga"] = df_leagues["Liga"].str.split(",")
-    df_leagues = df_leagues.explode("Liga")
-    df_leagues["Liga"] = df_leagues["Liga"].str.strip()
-    df_leagues = df_leagues[df_leagues["Liga"] != ""]
-
-    league_stats = df_leagues.groupby("Liga").agg(
-        Bets=("Profit", "count"),
-        Profit=("Profit", "sum"),
-    ).reset_index().sort_values("Bets", ascending=True)
-
     # Top 10 leagues
-    league_stats = league_stats.tail(10)
+    league_stats = league_stats.reset_index().sort_values("Bets", ascending=True).tail(10)
 
-    colors = ["#16a34a" if p >= 0 else "#dc2626" for p in league_stats["Profit"]]
+    colors = np.where(league_stats["Profit"] >= 0, "#16a34a", "#dc2626").tolist()
 
-    return json.dumps({
+    return to_json({
         "labels": league_stats["Liga"].tolist(),
         "bets": league_stats["Bets"].tolist(),
-        "profit": [round(v, 0) for v in league_stats["Profit"]],
+        "profit": to_kr(league_stats["Profit"]),
         "colors": colors,
     })
 
 
 def chart6_odds_data(df_bets: pd.DataFrame) -> str:
     """Odds per player — scatter + avg bar overlay."""
+    by_player = df_bets.groupby("Spiller", sort=False)["Odds"]
+    odds_by_player = dict(list(by_player))
+    summary = by_player.agg(["min", "mean", "max"]).round(2).reindex(PLAYER_ORDER, fill_value=0)
     datasets = []
-    for player in PLAYER_ORDER:
-        odds = df_bets[df_bets["Spiller"] == player]["Odds"].tolist()
+    for player, (low, avg, top) in zip(PLAYER_ORDER, summary.itertuples(index=False)):
+        player_odds = odds_by_player.get(player, pd.Series(dtype=float))
         datasets.append({
             "player": player,
-            "odds": [round(o, 2) for o in odds],
-            "avg": round(sum(odds) / len(odds), 2) if odds else 0,
-            "min": round(min(odds), 2) if odds else 0,
-            "max": round(max(odds), 2) if odds else 0,
+            "odds": player_odds.round(2).tolist(),
+            "avg": avg,
+            "min": low,
+            "max": top,
+            "maxDelta": round(top - avg, 2),
             "color": PLAYER_COLORS[player],
+            "minColor": PLAYER_COLORS[player] + "33",
+            "maxColor": PLAYER_COLORS[player] + "55",
         })
-    return json.dumps(datasets)
+    return to_json(datasets)
 
 
 def chart7_weekday_data(df_bets: pd.DataFrame) -> str:
     """Day-of-week bet counts per player."""
-    df = df_bets.copy()
-    df["Weekday"] = df["Dato"].dt.dayofweek
-
-    matrix = []
-    for pi, player in enumerate(PLAYER_ORDER):
-        pdf = df[df["Spiller"] == player]
-        counts = pdf["Weekday"].value_counts()
-        for d in range(7):
-            count = int(counts.get(d, 0))
-            if count > 0:
-                matrix.append({"x": d, "y": pi, "v": count})
-    return json.dumps({
-        "data": matrix,
+    player_codes = pd.Categorical(df_bets["Spiller"], categories=PLAYER_ORDER).codes
+    weekday = df_bets["Weekday"].to_numpy()
+    known = player_codes >= 0
+
+    counts = np.zeros((len(PLAYER_ORDER), 7), dtype=np.int32)
+    np.add.at(counts, (player_codes[known], weekday[known]), 1)
+    return to_json({
+        "matrix": counts.tolist(),
+        "max": int(counts.max()),
         "players": PLAYER_ORDER,
         "days": DANISH_WEEKDAYS,
     })
 
 
+def week_labels(weeks: pd.DataFrame) -> list[str]:
+    """'Spiller (dd/mm)' labels for a frame of weekly rows."""
+    return (weeks["Spiller"] + " (" + weeks["FirstDate"].dt.strftime("%d/%m") + ")").tolist()
+
+
 def chart8_best_worst_data(weekly: pd.DataFrame) -> str:
     """Best & worst weeks — horizontal bar."""
-    top = weekly.nlargest(5, "Profit")
-    bottom = weekly.nsmallest(5, "Profit")
-    combined = pd.concat([bottom, top]).reset_index(drop=True)
-
-    return json.dumps({
-        "labels": [f"{r['Spiller']} ({r['FirstDate'].strftime('%d/%m')})"
-                   for _, r in combined.iterrows()],
-        "data": [round(r["Profit"], 0) for _, r in combined.iterrows()],
-        "colors": [PLAYER_COLORS[r["Spiller"]] for _, r in combined.iterrows()],
+    profit = weekly["Profit"].to_numpy()
+    bottom = np.argsort(profit, kind="stable")[:5]
+    top = np.argsort(-profit, kind="stable")[:5]
+    combined = weekly.take(np.concatenate([bottom, top]))
+    return to_json({
+        "labels": week_labels(combined),
+        "data": to_kr(combined["Profit"]),
+        "colors": [PLAYER_COLORS[p] for p in combined["Spiller"]],
     })
 
 
 def chart_best_weeks_only(weekly: pd.DataFrame) -> str:
     """Top 5 best weeks only — horizontal bar (no worst weeks)."""
     top = weekly.nlargest(5, "Profit").sort_values("Profit", ascending=True)
-    return json.dumps({
-        "labels": [f"{r['Spiller']} ({r['FirstDate'].strftime('%d/%m')})"
-                   for _, r in top.iterrows()],
-        "data": [round(r["Profit"], 0) for _, r in top.iterrows()],
-        "colors": [PLAYER_COLORS[r["Spiller"]] for _, r in top.iterrows()],
+    return to_json({
+        "labels": week_labels(top),
+        "data": to_kr(top["Profit"]),
+        "colors": [PLAYER_COLORS[p] for p in top["Spiller"]],
     })
 
 
 def chart_worst_weeks_only(weekly: pd.DataFrame) -> str:
     """Bottom 5 worst weeks only — horizontal bar (no best weeks)."""
     bottom = weekly.nsmallest(5, "Profit").sort_values("Profit", ascending=True)
-    return json.dumps({
-        "labels": [f"{r['Spiller']} ({r['FirstDate'].strftime('%d/%m')})"
-                   for _, r in bottom.iterrows()],
-        "data": [round(r["Profit"], 0) for _, r in bottom.iterrows()],
-        "colors": [PLAYER_COLORS[r["Spiller"]] for _, r in bottom.iterrows()],
+    return to_json({
+        "labels": week_labels(bottom),
+        "data": to_kr(bottom["Profit"]),
+        "colors": [PLAYER_COLORS[p] for p in bottom["Spiller"]],
     })
 
 
@@ -362,8 +522,8 @@ def chart_cumulative_club(weekly: pd.DataFrame) -> str:
     """Club total cumulative P/L — single line (no per-player breakdown)."""
     club = weekly.groupby("FirstDate")["Profit"].sum().sort_index()
     cum = club.cumsum()
-    data = [{"x": d.strftime("%Y-%m-%d"), "y": round(v, 0)} for d, v in zip(cum.index, cum)]
-    return json.dumps([{
+    data = [{"x": x, "y": y} for x, y in zip(cum.index.strftime("%Y-%m-%d"), to_kr(cum))]
+    return to_json([{
         "label": "Klubben",
         "data": data,
         "borderColor": "#2563eb",
@@ -378,22 +538,19 @@ def chart_cumulative_club(weekly: pd.DataFrame) -> str:
 
 def chart_weekday_totals(df_bets: pd.DataFrame) -> str:
     """Total bets per weekday — simple bar chart."""
-    df = df_bets.copy()
-    df["Weekday"] = df["Dato"].dt.dayofweek
-    counts = df.groupby("Weekday").size()
-    profits = df.groupby("Weekday")["Profit"].sum()
-    labels = [DANISH_WEEKDAYS[d] for d in range(7)]
-    return json.dumps({
-        "labels": labels,
-        "data": [int(counts.get(d, 0)) for d in range(7)],
-        "profit": [round(float(profits.get(d, 0)), 0) for d in range(7)],
+    by_day = df_bets["Profit"].groupby(df_bets["Weekday"]).agg(["size", "sum"])
+    by_day = by_day.reindex(range(7), fill_value=0)
+    return to_json({
+        "labels": DANISH_WEEKDAYS,
+        "data": by_day["size"].tolist(),
+        "profit": to_kr(by_day["sum"]),
     })
 
 
 def chart_bets_per_player(stats: pd.DataFrame) -> str:
     """Bets per player — horizontal bar chart."""
     sorted_stats = stats.sort_values("Bets", ascending=True)
-    return json.dumps({
+    return to_json({
         "labels": sorted_stats["Spiller"].tolist(),
         "data": sorted_stats["Bets"].tolist(),
         "colors": [PLAYER_COLORS[p] for p in sorted_stats["Spiller"]],
@@ -401,13 +558,11 @@ def chart_bets_per_player(stats: pd.DataFrame) -> str:
 
 
 
-def chart_high_odds_per_player(df_bets: pd.DataFrame) -> str:
+def chart_high_odds_per_player(bet_metrics: pd.DataFrame) -> str:
     """High-odds (>=3) bet count per player — horizontal bar chart."""
-    counts = {}
-    for p in PLAYER_ORDER:
-        counts[p] = int(len(df_bets[(df_bets["Spiller"] == p) & (df_bets["Odds"] >= 3)]))
+    counts = bet_metrics["High Odds Bets"].to_dict()
     sorted_players = sorted(PLAYER_ORDER, key=lambda p: counts[p])
-    return json.dumps({
+    return to_json({
         "labels": sorted_players,
         "data": [counts[p] for p in sorted_players],
         "colors": [PLAYER_COLORS[p] for p in sorted_players],
@@ -417,43 +572,30 @@ def chart_high_odds_per_player(df_bets: pd.DataFrame) -> str:
 def chart_losses_per_player(stats: pd.DataFrame) -> str:
     """Only players with negative profit — horizontal bar (hides winners)."""
     losers = stats[stats["Total Profit"] < 0].sort_values("Total Profit", ascending=True)
-    return json.dumps({
+    return to_json({
         "labels": losers["Spiller"].tolist(),
-        "data": [round(v, 0) for v in losers["Total Profit"]],
+        "data": to_kr(losers["Total Profit"]),
         "colors": [PLAYER_COLORS[p] for p in losers["Spiller"]],
     })
 
 
-def chart_closer_rate(df_bets: pd.DataFrame) -> str:
+def chart_closer_rate(bet_metrics: pd.DataFrame) -> str:
     """Last-bet-of-week win rate per player — bar chart."""
-    iso = df_bets.copy()
-    iso["ISOWeek"] = iso["Dato"].dt.isocalendar()["week"].astype(int)
-    iso["ISOYear"] = iso["Dato"].dt.isocalendar()["year"].astype(int)
-    iso["WeekKey"] = iso["ISOYear"].astype(str) + "-W" + iso["ISOWeek"].astype(str).str.zfill(2)
-    last_bets = iso.sort_values("Dato").groupby(["WeekKey", "Spiller"]).tail(1)
-    rates = {}
-    for p in PLAYER_ORDER:
-        pl = last_bets[last_bets["Spiller"] == p]
-        wins = int(len(pl[pl["Profit"] > 0]))
-        total = int(len(pl))
-        rates[p] = round(wins / max(total, 1) * 100, 1)
+    rows = bet_metrics[["Closer Wins", "Closer Weeks"]].itertuples(name=None)
+    rates = {p: round(wins / max(total, 1) * 100, 1) for p, wins, total in rows}
     sorted_players = sorted(PLAYER_ORDER, key=lambda p: rates[p], reverse=True)
-    return json.dumps({
+    return to_json({
         "labels": sorted_players,
         "data": [rates[p] for p in sorted_players],
         "colors": [PLAYER_COLORS[p] for p in sorted_players],
     })
 
 
-def chart_best_winning_odds(df_bets: pd.DataFrame) -> str:
+def chart_best_winning_odds(bet_metrics: pd.DataFrame) -> str:
     """Each player's highest winning odds — horizontal bar chart."""
-    winners = df_bets[df_bets["Profit"] > 0]
-    best_odds = {}
-    for p in PLAYER_ORDER:
-        pw = winners[winners["Spiller"] == p]
-        best_odds[p] = round(float(pw["Odds"].max()), 2) if len(pw) > 0 else 0.0
+    best_odds = bet_metrics["Best Win Odds"].round(2).to_dict()
     sorted_players = sorted(PLAYER_ORDER, key=lambda p: best_odds[p])
-    return json.dumps({
+    return to_json({
         "labels": sorted_players,
         "data": [best_odds[p] for p in sorted_players],
         "colors": [PLAYER_COLORS[p] for p in sorted_players],
@@ -462,45 +604,45 @@ def chart_best_winning_odds(df_bets: pd.DataFrame) -> str:
 
 # ── 4. Award Cards ──────────────────────────────────────────────────────────
 
-def generate_award_cards(stats: pd.DataFrame, weekly: pd.DataFrame) -> str:
+def generate_award_cards(picks: dict[str, pd.Series]) -> str:
     awards = []
 
-    best = stats.loc[stats["Total Profit"].idxmax()]
+    best = picks["profit_max"]
     awards.append(card("💰", "Årets Pengemaskine", best["Spiller"],
                        f'+{best["Total Profit"]:,.0f} kr profit',
                        "Pengene printer bare. Resten kan lære noget."))
 
-    worst = stats.loc[stats["Total Profit"].idxmin()]
+    worst = picks["profit_min"]
     awards.append(card("🪦", "Bundskraberen", worst["Spiller"],
                        f'{worst["Total Profit"]:,.0f} kr profit',
                        "Nogen skal jo finansiere de andres gevinster."))
 
-    streak_best = stats.loc[stats["Win Streak"].idxmax()]
+    streak_best = picks["streak_max"]
     awards.append(card("🔥", "Den Vilde Stribe", streak_best["Spiller"],
                        f'{streak_best["Win Streak"]:.0f} vindende uger i træk',
                        "Uhyggeligt. Ringede bookmakerne?"))
 
-    odds_high = stats.loc[stats["Avg Odds"].idxmax()]
+    odds_high = picks["odds_max"]
     awards.append(card("🎰", "Odds-Junkie", odds_high["Spiller"],
                        f'Gns. odds: {odds_high["Avg Odds"]:.2f}',
                        "Go big or go home. Mest go home."))
 
-    odds_low = stats.loc[stats["Avg Odds"].idxmin()]
+    odds_low = picks["odds_min"]
     awards.append(card("🐌", "Sikansen", odds_low["Spiller"],
                        f'Gns. odds: {odds_low["Avg Odds"]:.2f}',
                        "Spænding? Nej tak. Sikkerhed først."))
 
-    roi_best = stats.loc[stats["ROI"].idxmax()]
+    roi_best = picks["roi_max"]
     awards.append(card("📈", "ROI-Kongen", roi_best["Spiller"],
                        f'{roi_best["ROI"]:+.1f}% afkast',
                        "Krone for krone den bedste investering."))
 
-    best_week = weekly.loc[weekly["Profit"].idxmax()]
+    best_week = picks["week_max"]
     awards.append(card("🎯", "Ugens Helt", best_week["Spiller"],
                        f'+{best_week["Profit"]:,.0f} kr på én uge',
                        f'Uge {best_week["WeekKey"]} var magisk.'))
 
-    worst_week = weekly.loc[weekly["Profit"].idxmin()]
+    worst_week = picks["week_min"]
     awards.append(card("💀", "Sorteper", worst_week["Spiller"],
                        f'{worst_week["Profit"]:,.0f} kr på én uge',
                        f'Uge {worst_week["WeekKey"]} var brutal.'))
@@ -521,8 +663,10 @@ def card(emoji: str, title: str, player: str, stat: str, subtitle: str) -> str:
 
 # ── 5. Quiz Generation ─────────────────────────────────────────────────────
 
-def generate_quiz_questions(stats: pd.DataFrame, weekly: pd.DataFrame,
-                            df_bets: pd.DataFrame, chart_data: dict) -> str:
+def generate_quiz_questions(picks: dict[str, pd.Series], stats: pd.DataFrame,
+                            weekly: pd.DataFrame, df_bets: pd.DataFrame,
+                            bet_metrics: pd.DataFrame, league_stats: pd.DataFrame,
+                            chart_data: dict) -> str:
     """Build JSON quiz questions from computed stats. Each question has
     question text, options, correct index, chart config, and ranking for reveal."""
     questions = []
@@ -537,24 +681,17 @@ def generate_quiz_questions(stats: pd.DataFrame, weekly: pd.DataFrame,
     def player_ranking(col: str, fmt: str = "+,.0f", suffix: str = " kr",
                        ascending: bool = False) -> list[dict]:
         sorted_stats = stats.sort_values(col, ascending=ascending)
-        return [{"name": r["Spiller"], "value": f'{r[col]:{fmt}}{suffix}'}
-                for _, r in sorted_stats.iterrows()]
-
-    # ── Compute shared data ──
-    profit_ranked = stats.sort_values("Total Profit", ascending=False)
+        return [{"name": name, "value": f'{value:{fmt}}{suffix}'}
+                for name, value in sorted_stats[["Spiller", col]].itertuples(index=False, name=None)]
 
     # ── Q1: BEST SINGLE WEEK (opener — answer is NOT the overall champ) ──
-    best_week_row = weekly.loc[weekly["Profit"].idxmax()]
+    best_week_row = picks["week_max"]
     best_week_player = best_week_row["Spiller"]
-    opts, ci = make_options(
-        best_week_player,
-        [p for p in PLAYER_ORDER if p != best_week_player])
-    best_weeks_ranked = []
-    for p in PLAYER_ORDER:
-        pw = weekly[weekly["Spiller"] == p]
-        bw = pw.loc[pw["Profit"].idxmax()]
-        best_weeks_ranked.append({"name": p, "value": f'{bw["Profit"]:+,.0f} kr'})
-    best_weeks_ranked.sort(key=lambda x: float(x["value"].replace(" kr", "").replace(",", "").replace("+", "")), reverse=True)
+    opts, ci = make_options(best_week_player, OTHER_PLAYERS[best_week_player])
+    best_weeks = stats.sort_values("Best Week", ascending=False, kind="stable")
+    best_weeks_ranked = [
+        {"name": p, "value": f'{v:+,.0f} kr'}
+        for p, v in zip(best_weeks["Spiller"], best_weeks["Best Week"])]
     questions.append({
         "question": "Hvem ramte den bedste enkeluge i hele 2025?",
         "options": opts, "correct": ci,
@@ -570,8 +707,8 @@ def generate_quiz_questions(stats: pd.DataFrame, weekly: pd.DataFrame,
     best_month_name = DANISH_MONTHS[best_month_num - 1]
     all_month_names = [DANISH_MONTHS[int(m) - 1] for m in month_totals.index]
     other_months = [m for m in all_month_names if m != best_month_name]
-    random.shuffle(other_months)
-    opts, ci = make_options(best_month_name, other_months[:3])
+    opts, ci = make_options(
+        best_month_name, random.sample(other_months, min(3, len(other_months))))
     month_ranking = [
         {"name": DANISH_MONTHS[int(m) - 1],
          "value": f'{v:+,.0f} kr'}
@@ -585,10 +722,8 @@ def generate_quiz_questions(stats: pd.DataFrame, weekly: pd.DataFrame,
     })
 
     # ── Q3: ODDS JUNKIE (highest avg odds) ──
-    odds_best = stats.loc[stats["Avg Odds"].idxmax()]
-    opts, ci = make_options(
-        odds_best["Spiller"],
-        [p for p in PLAYER_ORDER if p != odds_best["Spiller"]])
+    odds_best = picks["odds_max"]
+    opts, ci = make_options(odds_best["Spiller"], OTHER_PLAYERS[odds_best["Spiller"]])
     questions.append({
         "question": "Hvem er den største Odds-Junkie? (højeste gns. odds)",
         "options": opts, "correct": ci,
@@ -598,14 +733,11 @@ def generate_quiz_questions(stats: pd.DataFrame, weekly: pd.DataFrame,
     })
 
     # ── Q4: MOST POPULAR WEEKDAY (non-player, uses weekday data) ──
-    df_wd = df_bets.copy()
-    df_wd["Weekday"] = df_wd["Dato"].dt.dayofweek
-    wd_counts = df_wd["Weekday"].value_counts()
+    wd_counts = df_bets["Weekday"].value_counts()
     best_wd = int(wd_counts.idxmax())
     best_wd_name = DANISH_WEEKDAYS[best_wd]
     other_wds = [DANISH_WEEKDAYS[d] for d in range(7) if d != best_wd]
-    random.shuffle(other_wds)
-    opts, ci = make_options(best_wd_name, other_wds[:3])
+    opts, ci = make_options(best_wd_name, random.sample(other_wds, 3))
     wd_ranking = [
         {"name": DANISH_WEEKDAYS[int(d)], "value": f'{int(c)} bets'}
         for d, c in wd_counts.sort_values(ascending=False).items()]
@@ -618,10 +750,8 @@ def generate_quiz_questions(stats: pd.DataFrame, weekly: pd.DataFrame,
     })
 
     # ── Q5: MOST BETS (breaks up Gustav pair from Q3) ──
-    bets_best = stats.loc[stats["Bets"].idxmax()]
-    opts, ci = make_options(
-        bets_best["Spiller"],
-        [p for p in PLAYER_ORDER if p != bets_best["Spiller"]])
+    bets_best = picks["bets_max"]
+    opts, ci = make_options(bets_best["Spiller"], OTHER_PLAYERS[bets_best["Spiller"]])
     questions.append({
         "question": "Hvem lavede flest individuelle bets?",
         "options": opts, "correct": ci,
@@ -631,22 +761,15 @@ def generate_quiz_questions(stats: pd.DataFrame, weekly: pd.DataFrame,
     })
 
     # ── Q6: MOST PROFITABLE LEAGUE (non-player) ──
-    df_leagues = df_bets.copy()
-    df_leagues["Liga"] = df_leagues["Liga"].fillna("").astype(str).str.split(",")
-    df_leagues = df_leagues.explode("Liga")
-    df_leagues["Liga"] = df_leagues["Liga"].str.strip()
-    df_leagues = df_leagues[df_leagues["Liga"] != ""]
-    league_stats = df_leagues.groupby("Liga").agg(
-        Bets=("Profit", "count"), Profit=("Profit", "sum"))
     top5 = league_stats.sort_values("Bets", ascending=False).head(5)
     most_profitable = top5.sort_values("Profit", ascending=False).iloc[0]
     best_league = most_profitable.name
     other_leagues = [l for l in top5.index if l != best_league]
-    random.shuffle(other_leagues)
-    opts, ci = make_options(best_league, other_leagues[:3])
+    opts, ci = make_options(
+        best_league, random.sample(other_leagues, min(3, len(other_leagues))))
     league_ranking = [
-        {"name": l, "value": f'{r["Profit"]:+,.0f} kr ({r["Bets"]:.0f} bets)'}
-        for l, r in top5.sort_values("Profit", ascending=False).iterrows()]
+        {"name": l, "value": f'{profit:+,.0f} kr ({bets:.0f} bets)'}
+        for l, bets, profit in top5.sort_values("Profit", ascending=False).itertuples(name=None)]
     questions.append({
         "question": "Hvilken af vores top-ligaer gav mest profit?",
         "options": opts, "correct": ci,
@@ -689,17 +812,12 @@ def generate_quiz_questions(stats: pd.DataFrame, weekly: pd.DataFrame,
     })
 
     # ── Q8: MILDEST WORST WEEK ──
-    worst_per_player = {}
-    for p in PLAYER_ORDER:
-        pw = weekly[weekly["Spiller"] == p]
-        worst_per_player[p] = pw["Profit"].min()
+    worst_per_player = dict(zip(stats["Spiller"], stats["Worst Week"]))
     mildest_player = max(worst_per_player, key=worst_per_player.get)
     worst_weeks_ranked = [
         {"name": p, "value": f'{v:+,.0f} kr'}
         for p, v in sorted(worst_per_player.items(), key=lambda x: x[1], reverse=True)]
-    opts, ci = make_options(
-        mildest_player,
-        [p for p in PLAYER_ORDER if p != mildest_player])
+    opts, ci = make_options(mildest_player, OTHER_PLAYERS[mildest_player])
     questions.append({
         "question": "Hvem slap billigst i sin værste uge?",
         "options": opts, "correct": ci,
@@ -710,13 +828,9 @@ def generate_quiz_questions(stats: pd.DataFrame, weekly: pd.DataFrame,
     })
 
     # ── Q9: MOST HIGH-ODDS BETS (spaced from Q3 odds junkie) ──
-    high_odds_counts = {}
-    for p in PLAYER_ORDER:
-        high_odds_counts[p] = int(len(df_bets[(df_bets["Spiller"] == p) & (df_bets["Odds"] >= 3)]))
+    high_odds_counts = bet_metrics["High Odds Bets"].to_dict()
     ho_best_player = max(high_odds_counts, key=high_odds_counts.get)
-    opts, ci = make_options(
-        ho_best_player,
-        [p for p in PLAYER_ORDER if p != ho_best_player])
+    opts, ci = make_options(ho_best_player, OTHER_PLAYERS[ho_best_player])
     ho_ranking = [
         {"name": p, "value": f'{c} bets'}
         for p, c in sorted(high_odds_counts.items(), key=lambda x: x[1], reverse=True)]
@@ -729,14 +843,13 @@ def generate_quiz_questions(stats: pd.DataFrame, weekly: pd.DataFrame,
     })
 
     # ── Q10: THE BOTTOM ──
-    worst = profit_ranked.iloc[-1]
-    opts, ci = make_options(
-        worst["Spiller"],
-        [p for p in PLAYER_ORDER if p != worst["Spiller"]])
+    worst = picks["profit_min"]
+    opts, ci = make_options(worst["Spiller"], OTHER_PLAYERS[worst["Spiller"]])
     # Only show players who lost money — avoids leaking who is the most profitable
     losers = stats[stats["Total Profit"] < 0].sort_values("Total Profit", ascending=True)
-    loss_ranking = [{"name": r["Spiller"], "value": f'{r["Total Profit"]:+,.0f} kr'}
-                    for _, r in losers.iterrows()]
+    loss_rows = losers[["Spiller", "Total Profit"]].itertuples(index=False, name=None)
+    loss_ranking = [{"name": name, "value": f'{profit:+,.0f} kr'}
+                    for name, profit in loss_rows]
     questions.append({
         "question": "Hvem endte i bunden med størst tab?",
         "options": opts, "correct": ci,
@@ -748,9 +861,7 @@ def generate_quiz_questions(stats: pd.DataFrame, weekly: pd.DataFrame,
     # ── Q11: WIN RATE ──
     wr_ranked = stats.sort_values("Win Rate", ascending=False)
     wr_best = wr_ranked.iloc[0]
-    opts, ci = make_options(
-        wr_best["Spiller"],
-        [p for p in PLAYER_ORDER if p != wr_best["Spiller"]])
+    opts, ci = make_options(wr_best["Spiller"], OTHER_PLAYERS[wr_best["Spiller"]])
     questions.append({
         "question": "Hvem vandt flest af sine uger (højeste win rate)?",
         "options": opts, "correct": ci,
@@ -761,21 +872,10 @@ def generate_quiz_questions(stats: pd.DataFrame, weekly: pd.DataFrame,
     })
 
     # ── Q12: LAST BET CLOSER (who ends weeks on a win most often) ──
-    iso = df_bets.copy()
-    iso["ISOWeek"] = iso["Dato"].dt.isocalendar()["week"].astype(int)
-    iso["ISOYear"] = iso["Dato"].dt.isocalendar()["year"].astype(int)
-    iso["WeekKey"] = iso["ISOYear"].astype(str) + "-W" + iso["ISOWeek"].astype(str).str.zfill(2)
-    last_bets = iso.sort_values("Dato").groupby(["WeekKey", "Spiller"]).tail(1)
-    closer_stats = {}
-    for p in PLAYER_ORDER:
-        pl = last_bets[last_bets["Spiller"] == p]
-        wins = int(len(pl[pl["Profit"] > 0]))
-        total = int(len(pl))
-        closer_stats[p] = (wins, total)
+    closer_rows = bet_metrics[["Closer Wins", "Closer Weeks"]].itertuples(name=None)
+    closer_stats = {p: (wins, total) for p, wins, total in closer_rows}
     closer_best = max(closer_stats, key=lambda p: closer_stats[p][0] / max(closer_stats[p][1], 1))
-    opts, ci = make_options(
-        closer_best,
-        [p for p in PLAYER_ORDER if p != closer_best])
+    opts, ci = make_options(closer_best, OTHER_PLAYERS[closer_best])
     closer_ranking = [
         {"name": p, "value": f'{v[0]}/{v[1]} uger ({v[0]/max(v[1],1)*100:.0f}%)'}
         for p, v in sorted(closer_stats.items(),
@@ -790,20 +890,11 @@ def generate_quiz_questions(stats: pd.DataFrame, weekly: pd.DataFrame,
     })
 
     # ── Q13: BIGGEST LONGSHOT WIN ──
-    winners = df_bets[df_bets["Profit"] > 0]
-    best_longshot_odds = {}
-    for p in PLAYER_ORDER:
-        pw = winners[winners["Spiller"] == p]
-        if len(pw) > 0:
-            best_row = pw.loc[pw["Odds"].idxmax()]
-            best_longshot_odds[p] = (best_row["Odds"], best_row["Profit"])
-        else:
-            best_longshot_odds[p] = (0.0, 0.0)
+    longshot_rows = bet_metrics[["Best Win Odds", "Best Win Profit"]].itertuples(name=None)
+    best_longshot_odds = {p: (odds, profit) for p, odds, profit in longshot_rows}
     ls_player = max(best_longshot_odds, key=lambda p: best_longshot_odds[p][0])
     ls_odds, ls_profit = best_longshot_odds[ls_player]
-    opts, ci = make_options(
-        ls_player,
-        [p for p in PLAYER_ORDER if p != ls_player])
+    opts, ci = make_options(ls_player, OTHER_PLAYERS[ls_player])
     ls_ranking = [
         {"name": p, "value": f'odds {v[0]:.2f} (+{v[1]:,.0f} kr)'}
         for p, v in sorted(best_longshot_odds.items(), key=lambda x: x[1][0], reverse=True)]
@@ -837,10 +928,8 @@ def generate_quiz_questions(stats: pd.DataFrame, weekly: pd.DataFrame,
     })
 
     # ── Q15: THE CHAMPION — GRAND FINALE ──
-    best = profit_ranked.iloc[0]
-    opts, ci = make_options(
-        best["Spiller"],
-        [p for p in PLAYER_ORDER if p != best["Spiller"]])
+    best = picks["profit_max"]
+    opts, ci = make_options(best["Spiller"], OTHER_PLAYERS[best["Spiller"]])
     questions.append({
         "question": "Hvem blev årets Tipsklub-mester med mest profit?",
         "options": opts, "correct": ci,
@@ -849,54 +938,12 @@ def generate_quiz_questions(stats: pd.DataFrame, weekly: pd.DataFrame,
         "ranking": player_ranking("Total Profit"),
     })
 
-    return json.dumps(questions, ensure_ascii=False)
-
+    return to_json(questions)
 
-def generate_quiz_html(quiz_json: str, chart_data: dict,
-                       stats: pd.DataFrame, weekly: pd.DataFrame,
-                       df_bets: pd.DataFrame,
-                       turn_creds: dict | None = None) -> str:
-    """Build a standalone quiz HTML file with PeerJS for multiplayer."""
-    total_weeks = len(weekly)
-    total_bets = len(df_bets)
-    total_staked = df_bets["Indsats"].sum()
-    club_profit = df_bets["Profit"].sum()
-    date_from = df_bets["Dato"].min().strftime("%d/%m/%Y")
-    date_to = df_bets["Dato"].max().strftime("%d/%m/%Y")
-    n_players = df_bets["Spiller"].nunique()
 
-    # Build ICE servers list — Cloudflare TURN + Metered TURN fallback
-    ice_servers = [
-        {"urls": "stun:stun.l.google.com:19302"},
-        {"urls": "stun:stun1.l.google.com:19302"},
-    ]
-    if turn_creds:
-        ice_servers.append(turn_creds)
-    # Metered.ca static TURN fallback
-    metered_user = os.environ.get("METERED_TURN_USERNAME")
-    metered_pass = os.environ.get("METERED_TURN_CREDENTIAL")
-    if metered_user and metered_pass:
-        for url in [
-            "turn:standard.relay.metered.ca:80",
-            "turn:standard.relay.metered.ca:80?transport=tcp",
-            "turn:standard.relay.metered.ca:443",
-            "turns:standard.relay.metered.ca:443?transport=tcp",
-        ]:
-            ice_servers.append(
-                {"urls": url, "username": metered_user, "credential": metered_pass}
-            )
-        print("  Metered TURN servers added as fallback")
-    ice_servers_json = json.dumps(ice_servers)
-
-    # Quick stats for Q4 reveal
-    quick_stats_json = json.dumps({
-        "weeks": int(total_weeks),
-        "bets": int(total_bets),
-        "staked": round(total_staked, 0),
-        "profit": round(club_profit, 0),
-    })
-
-    return f"""<!DOCTYPE html>
+# Static quiz page. Rendered with str.format_map, so literal CSS/JS braces
+# are doubled; the only fields are the ones generate_quiz_html fills in.
+QUIZ_TEMPLATE = """<!DOCTYPE html>
 <html lang="da">
 <head>
 <meta charset="UTF-8">
@@ -905,8 +952,6 @@ def generate_quiz_html(quiz_json: str, chart_data: dict,
 <meta http-equiv="Pragma" content="no-cache">
 <meta http-equiv="Expires" content="0">
 <title>Tipsklub 2025 - Quiz</title>
-<script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.7/dist/chart.umd.min.js"></script>
-<script src="https://cdn.jsdelivr.net/npm/chartjs-adapter-date-fns@3.0.0/dist/chartjs-adapter-date-fns.bundle.min.js"></script>
 <script src="https://unpkg.com/peerjs@1.5.4/dist/peerjs.min.js"></script>
 <script src="https://cdn.jsdelivr.net/npm/qrcode-generator@1.4.4/qrcode.min.js"></script>
 <style>
@@ -1144,6 +1189,7 @@ body {{
         <div class="timer-text" id="hostTimerText"></div>
         <div class="timer-container"><div class="timer-bar" id="hostTimerBar"></div></div>
         <div class="host-options" id="hostOptions"></div>
+        <template id="tplHostOpt"><div class="host-opt"><span class="label"></span><span class="count">0</span></div></template>
         <div style="text-align:center;margin-top:12px;color:#64748b;font-size:.85rem;" id="hostVoteCount"></div>
         <button class="btn btn-reveal" id="btnReveal" onclick="hostReveal()" style="margin-top:16px;">Vis Svar</button>
     </div>
@@ -1158,9 +1204,7 @@ body {{
     <div style="margin-top:48px;width:100%;max-width:500px;display:flex;flex-direction:column;align-items:center;">
         <div class="reveal-text" id="revealText"></div>
         <div class="ranking-list" id="rankingList"></div>
-        <div class="chart-container" id="chartRevealContainer">
-            <canvas id="chartReveal" height="200"></canvas>
-        </div>
+        <div class="chart-container" id="chartRevealContainer"></div>
         <div class="qs-grid" id="quickStatsReveal" style="display:none;"></div>
         <div class="mini-sb" id="miniScoreboard"></div>
         <button class="btn btn-next" id="btnNext" onclick="hostNextQuestion()" style="margin-top:16px;">Næste Spørgsmål</button>
@@ -1175,6 +1219,7 @@ body {{
         <div class="timer-text" id="playerTimerText"></div>
         <div class="timer-container"><div class="timer-bar" id="playerTimerBar"></div></div>
         <div id="playerOptions" style="width:100%;"></div>
+        <template id="tplAnsBtn"><button class="answer-btn"></button></template>
     </div>
 </div>
 
@@ -1215,25 +1260,25 @@ body {{
 // ── Data (embedded at build time) ──
 const QUESTIONS = {quiz_json};
 const CHART_DATA = {{
-    cumulative: {chart_data['cumulative']},
-    leaderboard: {chart_data['leaderboard']},
-    winrate: {chart_data['winrate']},
-    monthly: {chart_data['monthly']},
-    leagues: {chart_data['leagues']},
-    odds: {chart_data['odds']},
-    bigweeks: {chart_data['bigweeks']},
-    bestWeeks: {chart_data['bestWeeks']},
-    worstWeeks: {chart_data['worstWeeks']},
-    cumulativeClub: {chart_data['cumulativeClub']},
-    weekdayTotal: {chart_data['weekdayTotal']},
-    betsPerPlayer: {chart_data['betsPerPlayer']},
-    highOddsPerPlayer: {chart_data['highOddsPerPlayer']},
-    lossesPerPlayer: {chart_data['lossesPerPlayer']},
-    closerRate: {chart_data['closerRate']},
-    bestWinningOdds: {chart_data['bestWinningOdds']},
+    cumulative: {chart_data[cumulative]},
+    leaderboard: {chart_data[leaderboard]},
+    winrate: {chart_data[winrate]},
+    monthly: {chart_data[monthly]},
+    leagues: {chart_data[leagues]},
+    odds: {chart_data[odds]},
+    bigweeks: {chart_data[bigweeks]},
+    bestWeeks: {chart_data[bestWeeks]},
+    worstWeeks: {chart_data[worstWeeks]},
+    cumulativeClub: {chart_data[cumulativeClub]},
+    weekdayTotal: {chart_data[weekdayTotal]},
+    betsPerPlayer: {chart_data[betsPerPlayer]},
+    highOddsPerPlayer: {chart_data[highOddsPerPlayer]},
+    lossesPerPlayer: {chart_data[lossesPerPlayer]},
+    closerRate: {chart_data[closerRate]},
+    bestWinningOdds: {chart_data[bestWinningOdds]},
 }};
 const QUICK_STATS = {quick_stats_json};
-const PLAYER_COLORS = {json.dumps(PLAYER_COLORS)};
+const PLAYER_COLORS = new Map(Object.entries({player_colors_json}));
 
 // ── QR Code ──
 function drawQR(canvas, text) {{
@@ -1245,38 +1290,72 @@ function drawQR(canvas, text) {{
     const size = cellSize * modules;
     canvas.width = size;
     canvas.height = size;
-    const ctx = canvas.getContext('2d');
-    ctx.fillStyle = '#fff';
-    ctx.fillRect(0, 0, size, size);
+    // Paint one pixel per module, then scale it up in a single drawImage
+    const img = new ImageData(modules, modules);
+    const px = img.data;
     for (let r = 0; r < modules; r++) {{
         for (let c = 0; c < modules; c++) {{
-            ctx.fillStyle = qr.isDark(r, c) ? '#1e293b' : '#fff';
-            ctx.fillRect(c * cellSize, r * cellSize, cellSize, cellSize);
+            const o = (r * modules + c) * 4;
+            if (qr.isDark(r, c)) {{
+                px[o] = 0x1e; px[o + 1] = 0x29; px[o + 2] = 0x3b;
+            }} else {{
+                px[o] = px[o + 1] = px[o + 2] = 0xff;
+            }}
+            px[o + 3] = 0xff;
         }}
     }}
+    const src = document.createElement('canvas');
+    src.width = modules;
+    src.height = modules;
+    src.getContext('2d').putImageData(img, 0, 0);
+    const ctx = canvas.getContext('2d');
+    ctx.imageSmoothingEnabled = false;
+    ctx.drawImage(src, 0, 0, size, size);
 }}
 
 // ── State ──
 let mode = ''; // 'host' or 'player'
 let peer = null;
-let connections = []; // host: array of DataConnection
+const connections = new Set(); // host: open DataConnections
 let hostConn = null; // player: DataConnection to host
 let roomCode = '';
-let players = {{}}; // host: {{connId: {{name, score, answered, correct_count}}}}
+let players = new Map(); // host: connId -> {{name, color, score, answered, correct_count, answers}}
 let currentQ = 0;
-let votes = {{}}; // host: {{optionIndex: [playerNames]}}
+let playerVotes = new Map(); // host: playerName -> optionIndex, in order of latest answer
+let voteCounts = new Int32Array(0); // host: number of votes per option
+let shownVoteCounts = new Int32Array(0); // host: counts currently on screen
+let totalVotes = 0; // host: players who have answered the current question
+let playerCount = 0; // host: connected players, refreshed by schedulePlayerListRender
+let playerListPending = false;
+const playerChips = new Map(); // host: name -> lobby chip element
 let myAnswer = -1;
 let myScore = 0;
 let myCorrectCount = 0;
-let answerOrder = []; // host: tracks order of correct answers for speed bonus
-let revealChart = null;
+let answerOrder = new Set(); // host: connIds of correct answers, in answer order, for speed bonus
+let revealCharts = {{}}; // host: chartId -> Chart
+let revealCanvases = {{}}; // host: chartId -> the canvas its chart draws on
+let shownChartId = null;
 let quizStarted = false;
 let disconnectedPlayers = {{}}; // host: name -> player data (preserved on disconnect)
 const TIMER_DURATION = 30; // seconds per question
+// Answers are the most frequent player→host message, so they travel as a
+// compact [MSG_ANSWER, questionIndex, optionIndex] tuple instead of a keyed
+// object. The question index lets the host drop answers that arrive late.
+const MSG_ANSWER = 1;
 let timerRAF = null;
 let questionStartTime = 0;
 let answersLocked = false;
 let lastEarned = {{}}; // host: connId -> points earned this round
+let hostOptEls = []; // host: option elements of the current question
+let voteCountEls = []; // host: .count element per option of the current question
+let ansBtnEls = []; // player: answer buttons of the current question
+// host: looked up once, since they are rewritten on every answer and question
+const hostVoteCountEl = document.getElementById('hostVoteCount');
+const btnRevealEl = document.getElementById('btnReveal');
+let voteRenderPending = false;
+let answerSendPending = false; // player: an answer send is scheduled for the next frame
+let answerSendRAF = 0; // player: requestAnimationFrame id of that send
+let myQuestion = -1; // player: index of the question on screen
 let audioCtx = null;
 
 // ── Audio (Web Audio API) ──
@@ -1410,9 +1489,12 @@ function showScorePopup(text) {{
 }}
 
 // ── Screen management ──
+const allScreens = document.querySelectorAll('.screen');
+let currentScreen = document.querySelector('.screen.active')?.id;
 function showScreen(id) {{
-    document.querySelectorAll('.screen').forEach(s => s.classList.remove('active'));
-    document.getElementById(id).classList.add('active');
+    if (id === currentScreen) return;
+    currentScreen = id;
+    allScreens.forEach(s => s.classList.toggle('active', s.id === id));
 }}
 function updateProgress() {{
     const pct = quizStarted ? ((currentQ + 1) / QUESTIONS.length * 100) : 0;
@@ -1425,6 +1507,7 @@ const ICE_CONFIG = {{iceServers: {ice_servers_json}}};
 // ── HOST ──
 function startHost() {{
     mode = 'host';
+    ensureChart().catch(() => {{}}); // retried on the first reveal
     roomCode = genCode();
     document.getElementById('roomCodeDisplay').textContent = roomCode;
     const peerId = 'tipsklub-' + roomCode.toLowerCase();
@@ -1447,106 +1530,178 @@ function startHost() {{
     }});
     peer.on('connection', (conn) => {{
         conn.on('open', () => {{
-            connections.push(conn);
+            connections.add(conn);
             conn.on('data', (data) => handleHostMessage(conn, data));
             conn.on('close', () => {{
-                connections = connections.filter(c => c !== conn);
-                const p = players[conn.connectionId];
+                connections.delete(conn);
+                const p = players.get(conn.connectionId);
                 if (p) {{
                     // Preserve player data for reconnection
                     disconnectedPlayers[p.name] = p;
-                    delete players[conn.connectionId];
+                    players.delete(conn.connectionId);
                 }}
-                updatePlayerList();
+                schedulePlayerListRender();
             }});
         }});
     }});
 }}
 
 function genCode() {{
+    // 24-letter alphabet: draw 5-bit values and reject the 8 out of range
     const chars = 'ABCDEFGHJKLMNPQRSTUVWXYZ';
+    const buf = crypto.getRandomValues(new Uint8Array(8));
     let code = '';
-    for (let i = 0; i < 4; i++) code += chars[Math.floor(Math.random() * chars.length)];
-    return code;
+    for (let j = 0; j < buf.length && code.length < 4; j++) {{
+        const v = buf[j] & 0x1f;
+        if (v < chars.length) code += chars[v];
+    }}
+    return code.length === 4 ? code : genCode();
+}}
+
+// Serialize a host→players message once and hand the same bytes to every
+// data channel. Players connect with serialization: 'json', whose wire
+// format is the UTF-8 JSON text, so this matches what conn.send() would
+// produce per connection. Busy or non-JSON channels go through conn.send().
+// NOTE: this fast path relies on PeerJS internals (conn.dataChannel, the
+// 16300-byte chunk limit and the JSON framing) of the peerjs@1.5.4 script
+// pinned above; re-check it before bumping that version.
+const wireEncoder = new TextEncoder();
+function broadcast(msg) {{
+    const bytes = wireEncoder.encode(JSON.stringify(msg));
+    connections.forEach(c => {{
+        const dc = c.dataChannel;
+        if (c.serialization === 'json' && dc && dc.readyState === 'open'
+                && dc.bufferedAmount === 0 && bytes.byteLength < 16300) {{
+            try {{
+                dc.send(bytes);
+                return;
+            }} catch (err) {{
+                console.warn('Direct send failed, using conn.send:', err);
+            }}
+        }}
+        c.send(msg);
+    }});
 }}
 
 function handleHostMessage(conn, data) {{
+    if (Array.isArray(data) && data[0] === MSG_ANSWER) {{
+        data = {{ type: 'answer', index: data[1], option: data[2] }};
+    }}
     if (data.type === 'join') {{
         // Check if reconnecting player
         if (disconnectedPlayers[data.name]) {{
-            players[conn.connectionId] = disconnectedPlayers[data.name];
+            players.set(conn.connectionId, disconnectedPlayers[data.name]);
             delete disconnectedPlayers[data.name];
             console.log('Player reconnected:', data.name);
         }} else {{
-            players[conn.connectionId] = {{ name: data.name, score: 0, answered: false, correct_count: 0, answers: [] }};
+            players.set(conn.connectionId, {{
+                name: data.name, color: PLAYER_COLORS.get(data.name) || '#2563eb',
+                score: 0, answered: false, correct_count: 0, answers: [],
+            }});
         }}
-        updatePlayerList();
+        schedulePlayerListRender();
         conn.send({{ type: 'joined', name: data.name }});
 
         // If quiz is in progress, send current question
         if (quizStarted && currentQ < QUESTIONS.length) {{
-            const q = QUESTIONS[currentQ];
-            conn.send({{ type: 'question', index: currentQ, question: q.question, options: q.options }});
+            conn.send({{ type: 'question', index: currentQ }});
         }}
     }}
     if (data.type === 'answer') {{
         if (answersLocked) return; // Timer expired
-        const p = players[conn.connectionId];
+        if (data.index !== currentQ) return; // sent for an earlier question
+        const p = players.get(conn.connectionId);
         if (!p) return;
+        const q = QUESTIONS[currentQ];
         const optIdx = parseInt(data.option);
-
-        // Remove previous vote if changing answer
-        if (p.answered) {{
-            for (const key of Object.keys(votes)) {{
-                const arr = votes[key];
-                const idx = arr.indexOf(p.name);
-                if (idx !== -1) arr.splice(idx, 1);
-            }}
-            answerOrder = answerOrder.filter(id => id !== conn.connectionId);
+        // Ignore malformed picks before any vote state is touched
+        if (!isValidOption(q, optIdx)) return;
+
+        // voteCounts, totalVotes and playerVotes always move together, so the
+        // vote bars and the "x / y har svaret" line cannot drift apart
+        const prev = playerVotes.get(p.name);
+        if (prev !== undefined) {{
+            voteCounts[prev]--;
+            playerVotes.delete(p.name); // re-inserted below so the map stays in answer order
+            answerOrder.delete(conn.connectionId);
+        }} else {{
+            totalVotes++;
         }}
+        playerVotes.set(p.name, optIdx);
+        voteCounts[optIdx]++;
 
         p.answered = true;
         p.answerTime = Date.now() - questionStartTime; // track response time
-        if (!votes[optIdx]) votes[optIdx] = [];
-        votes[optIdx].push(p.name);
 
         // Track correct answer order for speed bonus (first correct stays first)
-        const q = QUESTIONS[currentQ];
         if (optIdx === q.correct) {{
-            answerOrder.push(conn.connectionId);
+            answerOrder.add(conn.connectionId);
         }}
 
-        updateHostVotes();
+        scheduleVoteRender();
     }}
 }}
 
+// voteCounts is an Int32Array, which silently ignores writes at NaN or
+// out-of-range indices; every vote update must pass this check first.
+function isValidOption(q, optIdx) {{
+    return Number.isInteger(optIdx) && optIdx >= 0 && optIdx < q.options.length;
+}}
+
+// Players tend to join (and drop) in bursts; redraw the lobby once per frame
+function schedulePlayerListRender() {{
+    playerCount = players.size;
+    if (playerListPending) return;
+    playerListPending = true;
+    requestAnimationFrame(() => {{
+        playerListPending = false;
+        updatePlayerList();
+    }});
+}}
+
+// Chips are kept per name and only their dot colour, opacity and label are
+// touched, so a join or drop never reparses the rest of the lobby.
 function updatePlayerList() {{
     const list = document.getElementById('playerList');
-    const connected = Object.values(players).map(p => p.name);
-    const disconnected = Object.keys(disconnectedPlayers);
-    let html = connected.map(n => {{
-        const color = PLAYER_COLORS[n] || '#2563eb';
-        return `<div class="player-chip"><div class="player-dot" style="background:${{color}}"></div>${{n}}</div>`;
-    }}).join('');
-    html += disconnected.map(n => {{
-        return `<div class="player-chip" style="opacity:.4"><div class="player-dot" style="background:#64748b"></div>${{n}} (frakoblet)</div>`;
-    }}).join('');
-    list.innerHTML = html;
+    const seen = new Set();
+    const place = (name, color, away) => {{
+        let chip = playerChips.get(name);
+        if (!chip) {{
+            chip = makeEl('div', 'player-chip');
+            chip.append(makeEl('div', 'player-dot'), '');
+            playerChips.set(name, chip);
+        }}
+        chip.style.opacity = away ? '.4' : '';
+        chip.firstChild.style.background = away ? '#64748b' : color;
+        chip.lastChild.data = away ? name + ' (frakoblet)' : name;
+        list.appendChild(chip); // moves an existing chip, keeping join order
+        seen.add(name);
+    }};
+    for (const p of players.values()) place(p.name, p.color, false);
+    for (const n in disconnectedPlayers) place(n, null, true);
+    for (const [name, chip] of playerChips) {{
+        if (!seen.has(name)) {{
+            chip.remove();
+            playerChips.delete(name);
+        }}
+    }}
 }}
 
-function updateHostVotes() {{
-    const q = QUESTIONS[currentQ];
-    const totalPlayers = Object.keys(players).length;
-    const totalVotes = Object.values(votes).reduce((s, arr) => s + arr.length, 0);
+// Answers tend to arrive in bursts; collapse them into one DOM pass per frame
+function scheduleVoteRender() {{
+    if (voteRenderPending) return;
+    voteRenderPending = true;
+    requestAnimationFrame(() => {{ if (voteRenderPending) updateHostVotes(); }});
+}}
 
-    q.options.forEach((opt, i) => {{
-        const count = (votes[i] || []).length;
-        const el = document.getElementById('hostOpt' + i);
-        if (el) {{
-            el.querySelector('.count').textContent = count;
-        }}
+function updateHostVotes() {{
+    voteRenderPending = false;
+    // Only touch the counters whose value actually moved since the last frame
+    voteCountEls.forEach((el, i) => {{
+        if (voteCounts[i] !== shownVoteCounts[i]) el.textContent = shownVoteCounts[i] = voteCounts[i];
     }});
-    document.getElementById('hostVoteCount').textContent = totalVotes + ' / ' + totalPlayers + ' har svaret';
+    const status = totalVotes + ' / ' + playerCount + ' har svaret';
+    if (hostVoteCountEl.textContent !== status) hostVoteCountEl.textContent = status;
 }}
 
 function hostStartQuiz() {{
@@ -1557,11 +1712,14 @@ function hostStartQuiz() {{
 
 function hostSendQuestion() {{
     const q = QUESTIONS[currentQ];
-    votes = {{}};
-    answerOrder = [];
+    playerVotes = new Map();
+    voteCounts = new Int32Array(q.options.length);
+    shownVoteCounts = new Int32Array(q.options.length);
+    totalVotes = 0;
+    answerOrder = new Set();
     lastEarned = {{}};
     answersLocked = false;
-    Object.values(players).forEach(p => {{ p.answered = false; p.answerTime = null; }});
+    players.forEach(p => {{ p.answered = false; p.answerTime = null; }});
 
     // Update host screen
     document.getElementById('statusRoom').textContent = roomCode;
@@ -1569,16 +1727,19 @@ function hostSendQuestion() {{
     document.getElementById('hostQNum').textContent = 'Spørgsmål ' + (currentQ + 1) + ' af ' + QUESTIONS.length;
     document.getElementById('hostQText').textContent = q.question;
 
-    let optsHtml = '';
-    q.options.forEach((opt, i) => {{
-        optsHtml += `<div class="host-opt" id="hostOpt${{i}}"><span>${{opt}}</span><span class="count">0</span></div>`;
+    const tplOpt = document.getElementById('tplHostOpt').content.firstElementChild;
+    hostOptEls = q.options.map((opt, i) => {{
+        const el = tplOpt.cloneNode(true);
+        el.id = 'hostOpt' + i;
+        el.querySelector('.label').textContent = opt;
+        return el;
     }});
-    document.getElementById('hostOptions').innerHTML = optsHtml;
-    document.getElementById('hostVoteCount').textContent = '0 / ' + Object.keys(players).length + ' har svaret';
-    const btn = document.getElementById('btnReveal');
-    btn.className = 'btn btn-reveal';
-    btn.textContent = 'Vis Svar';
-    btn.onclick = hostReveal;
+    voteCountEls = hostOptEls.map(el => el.querySelector('.count'));
+    document.getElementById('hostOptions').replaceChildren(...hostOptEls);
+    hostVoteCountEl.textContent = '0 / ' + playerCount + ' har svaret';
+    btnRevealEl.className = 'btn btn-reveal';
+    btnRevealEl.textContent = 'Vis Svar';
+    btnRevealEl.onclick = hostReveal;
 
     updateProgress();
     showScreen('screenHostQ');
@@ -1589,45 +1750,46 @@ function hostSendQuestion() {{
         document.getElementById('hostTimerText').textContent = 'Tid!';
     }});
 
-    // Send to players
-    const msg = {{ type: 'question', index: currentQ, question: q.question, options: q.options, timer: TIMER_DURATION }};
-    connections.forEach(c => c.send(msg));
+    // Send to players. They load the same page and so already have QUESTIONS;
+    // the index is enough for them to render the question.
+    const msg = {{ type: 'question', index: currentQ, timer: TIMER_DURATION }};
+    broadcast(msg);
 }}
 
 function hostReveal() {{
     stopTimer();
     answersLocked = true;
     const q = QUESTIONS[currentQ];
-    document.getElementById('btnReveal').classList.add('btn-disabled');
+    if (voteRenderPending) updateHostVotes(); // flush counts before the options are rewritten
+    btnRevealEl.classList.add('btn-disabled');
 
     // Highlight correct/wrong and show who picked what
+    const votes = q.options.map(() => []);
+    for (const [name, i] of playerVotes) votes[i].push(name);
     q.options.forEach((opt, i) => {{
-        const el = document.getElementById('hostOpt' + i);
+        const el = hostOptEls[i];
         el.classList.add(i === q.correct ? 'correct' : 'wrong');
-        const names = votes[i] || [];
+        const names = votes[i];
         if (names.length > 0) {{
-            el.innerHTML += `<div class="vote-names">${{names.join(', ')}}</div>`;
+            el.appendChild(makeEl('div', 'vote-names', names.join(', ')));
         }}
     }});
 
     // Calculate time-based scores and record answers
+    const timerMs = TIMER_DURATION * 1000;
+    const correctText = q.options[q.correct];
+    const [firstCorrect] = answerOrder;
     lastEarned = {{}};
-    Object.entries(players).forEach(([connId, p]) => {{
-        let playerVote = -1;
-        Object.entries(votes).forEach(([optIdx, names]) => {{
-            if (names.includes(p.name)) playerVote = parseInt(optIdx);
-        }});
+    for (const [connId, p] of players) {{
+        const playerVote = playerVotes.get(p.name) ?? -1;
         const wasCorrect = playerVote === q.correct;
         let earned = 0;
         if (wasCorrect) {{
             // Time-based scoring: 500-1000 pts based on response time
-            const elapsed = p.answerTime || (TIMER_DURATION * 1000);
-            const timeFraction = Math.min(elapsed / (TIMER_DURATION * 1000), 1);
+            const timeFraction = Math.min((p.answerTime || timerMs) / timerMs, 1);
             earned = Math.round(500 + 500 * (1 - timeFraction));
             // Speed bonus: +200 for first correct answer
-            if (answerOrder.length > 0 && answerOrder[0] === connId) {{
-                earned += 200;
-            }}
+            if (firstCorrect === connId) earned += 200;
             p.score += earned;
             p.correct_count += 1;
         }}
@@ -1635,27 +1797,24 @@ function hostReveal() {{
         p.answers.push({{
             question: q.question,
             picked: playerVote >= 0 ? q.options[playerVote] : '—',
-            correct: q.options[q.correct],
+            correct: correctText,
             right: wasCorrect,
         }});
-    }});
+    }}
 
-    // Send reveal to each player with their individual earned points
-    const scores = {{}};
-    Object.values(players).forEach(p => {{ scores[p.name] = p.score; }});
-    connections.forEach(c => {{
-        const p = players[c.connectionId];
+    // Send reveal to each player with only their own earned points and total
+    for (const c of connections) {{
+        const p = players.get(c.connectionId);
         const earned = lastEarned[c.connectionId] || 0;
-        c.send({{ type: 'reveal', correct: q.correct, correctText: q.options[q.correct], earned, scores }});
-    }});
+        c.send({{ type: 'reveal', correct: q.correct, correctText, earned, score: p ? p.score : 0 }});
+    }}
 
     // Change button to advance to chart/ranking reveal
-    const btn = document.getElementById('btnReveal');
-    btn.classList.remove('btn-disabled');
-    btn.classList.remove('btn-reveal');
-    btn.classList.add('btn-next');
-    btn.textContent = 'Vis Detaljer';
-    btn.onclick = () => showRevealScreen(q);
+    btnRevealEl.classList.remove('btn-disabled');
+    btnRevealEl.classList.remove('btn-reveal');
+    btnRevealEl.classList.add('btn-next');
+    btnRevealEl.textContent = 'Vis Detaljer';
+    btnRevealEl.onclick = () => showRevealScreen(q);
 }}
 
 function showRevealScreen(q) {{
@@ -1664,65 +1823,56 @@ function showRevealScreen(q) {{
     document.getElementById('revealText').textContent = q.reveal;
 
     // Render ranking list
-    const rankEl = document.getElementById('rankingList');
-    if (q.ranking && q.ranking.length > 0) {{
-        rankEl.innerHTML = q.ranking.map((r, i) => {{
-            const cls = i === 0 ? 'rank-row gold' : 'rank-row';
-            const color = PLAYER_COLORS[r.name] || '';
-            const nameStyle = color ? ` style="color:${{color}}"` : '';
-            return `<div class="${{cls}}"><span class="rank-pos">${{i+1}}.</span><span class="rank-name"${{nameStyle}}>${{r.name}}</span><span class="rank-val">${{r.value}}</span></div>`;
-        }}).join('');
-    }} else {{
-        rankEl.innerHTML = '';
-    }}
+    const rankFrag = document.createDocumentFragment();
+    (q.ranking || []).forEach((r, i) => {{
+        const row = makeEl('div', i === 0 ? 'rank-row gold' : 'rank-row');
+        const name = makeEl('span', 'rank-name', r.name);
+        if (PLAYER_COLORS.has(r.name)) name.style.color = PLAYER_COLORS.get(r.name);
+        row.append(makeEl('span', 'rank-pos', (i + 1) + '.'), name, makeEl('span', 'rank-val', r.value));
+        rankFrag.appendChild(row);
+    }});
+    document.getElementById('rankingList').replaceChildren(rankFrag);
 
     const chartContainer = document.getElementById('chartRevealContainer');
     const qsContainer = document.getElementById('quickStatsReveal');
 
-    // Destroy previous chart
-    if (revealChart) {{ revealChart.destroy(); revealChart = null; }}
-
     if (q.chartId === 'quickstats') {{
         chartContainer.style.display = 'none';
         qsContainer.style.display = 'grid';
-        const qs = QUICK_STATS;
-        const profitColor = qs.profit >= 0 ? '#16a34a' : '#dc2626';
-        qsContainer.innerHTML = `
-            <div class="qs-item"><div class="val">${{qs.weeks}}</div><div class="lbl">Uger spillet</div></div>
-            <div class="qs-item"><div class="val">${{qs.bets}}</div><div class="lbl">Bets i alt</div></div>
-            <div class="qs-item"><div class="val">${{qs.staked.toLocaleString('da-DK')}}</div><div class="lbl">Satset (kr)</div></div>
-            <div class="qs-item"><div class="val" style="color:${{profitColor}}">${{qs.profit >= 0 ? '+' : ''}}${{qs.profit.toLocaleString('da-DK')}}</div><div class="lbl">Klub Profit</div></div>
-        `;
+        if (!qsContainer.firstElementChild) {{
+            // The club totals never change during a quiz, so the tiles are built once
+            const qs = QUICK_STATS;
+            const profitColor = qs.profit >= 0 ? '#16a34a' : '#dc2626';
+            qsContainer.innerHTML = `
+                <div class="qs-item"><div class="val">${{qs.weeks}}</div><div class="lbl">Uger spillet</div></div>
+                <div class="qs-item"><div class="val">${{qs.bets}}</div><div class="lbl">Bets i alt</div></div>
+                <div class="qs-item"><div class="val">${{qs.staked.toLocaleString('da-DK')}}</div><div class="lbl">Satset (kr)</div></div>
+                <div class="qs-item"><div class="val" style="color:${{profitColor}}">${{qs.profit >= 0 ? '+' : ''}}${{qs.profit.toLocaleString('da-DK')}}</div><div class="lbl">Klub Profit</div></div>
+            `;
+        }}
     }} else {{
         chartContainer.style.display = 'block';
         qsContainer.style.display = 'none';
 
-        // Replace canvas (Chart.js reuse quirk)
-        const oldCanvas = document.getElementById('chartReveal');
-        const newCanvas = document.createElement('canvas');
-        newCanvas.id = 'chartReveal';
-        newCanvas.height = 200;
-        oldCanvas.parentNode.replaceChild(newCanvas, oldCanvas);
-
-        revealChart = renderChart(newCanvas, q.chartId);
+        showRevealChart(chartContainer, q.chartId);
     }}
 
     // Mini-scoreboard (live standings)
-    const miniSb = document.getElementById('miniScoreboard');
-    const sorted = Object.values(players).sort((a, b) => b.score - a.score);
-    miniSb.innerHTML = '<div class="mini-sb-title">Standings</div>' +
-        sorted.map((p, i) => {{
-            const color = PLAYER_COLORS[p.name] || '#2563eb';
-            const connId = Object.entries(players).find(([k, v]) => v === p)?.[0];
-            const earned = connId ? (lastEarned[connId] || 0) : 0;
-            const earnedHtml = earned > 0 ? `<span class="mini-sb-earned">+${{earned}}</span>` : '';
-            const posClass = i === 0 ? 'mini-sb-pos first' : 'mini-sb-pos';
-            return `<div class="mini-sb-row" style="animation-delay:${{i * 0.08}}s">
-                <span class="${{posClass}}">${{i + 1}}.</span>
-                <span class="mini-sb-name" style="color:${{color}}">${{p.name}}</span>
-                <span class="mini-sb-score">${{p.score}}</span>${{earnedHtml}}
-            </div>`;
-        }}).join('');
+    const sorted = [...players].sort(([, a], [, b]) => b.score - a.score);
+    const miniFrag = document.createDocumentFragment();
+    miniFrag.appendChild(makeEl('div', 'mini-sb-title', 'Standings'));
+    sorted.forEach(([connId, p], i) => {{
+        const row = makeEl('div', 'mini-sb-row');
+        row.style.animationDelay = (i * 0.08) + 's';
+        const name = makeEl('span', 'mini-sb-name', p.name);
+        name.style.color = p.color;
+        row.append(makeEl('span', i === 0 ? 'mini-sb-pos first' : 'mini-sb-pos', (i + 1) + '.'),
+                   name, makeEl('span', 'mini-sb-score', p.score));
+        const earned = lastEarned[connId] || 0;
+        if (earned > 0) row.appendChild(makeEl('span', 'mini-sb-earned', '+' + earned));
+        miniFrag.appendChild(row);
+    }});
+    document.getElementById('miniScoreboard').replaceChildren(miniFrag);
 
     // Button text
     const btnNext = document.getElementById('btnNext');
@@ -1735,6 +1885,58 @@ function showRevealScreen(q) {{
     showScreen('screenHostReveal');
 }}
 
+// Chart.js is only needed on the host's reveal screen, so players never
+// download it; the host starts loading it as soon as a room is opened.
+const CHART_SCRIPTS = [
+    'https://cdn.jsdelivr.net/npm/chart.js@4.4.7/dist/chart.umd.min.js',
+    'https://cdn.jsdelivr.net/npm/chartjs-adapter-date-fns@3.0.0/dist/chartjs-adapter-date-fns.bundle.min.js',
+];
+let chartLoad = null;
+function ensureChart() {{
+    if (!chartLoad) {{
+        chartLoad = CHART_SCRIPTS.reduce((prev, src) => prev.then(() => new Promise((resolve, reject) => {{
+            const el = document.createElement('script');
+            el.src = src;
+            el.onload = resolve;
+            el.onerror = reject;
+            document.head.appendChild(el);
+        }})), Promise.resolve()).catch(err => {{
+            chartLoad = null; // allow a retry on the next reveal
+            throw err;
+        }});
+    }}
+    return chartLoad;
+}}
+
+// Charts are built once per chartId and kept; showing one again just
+// replays its entry animation instead of constructing a new Chart. The
+// canvas swap happens now, while Chart.js (which measures the canvas) runs
+// in the next frame, once the reveal screen has been laid out.
+function showRevealChart(container, chartId) {{
+    const prev = revealCanvases[shownChartId];
+    if (prev) prev.style.display = 'none';
+    shownChartId = chartId;
+
+    let canvas = revealCanvases[chartId];
+    if (canvas) {{
+        canvas.style.display = '';
+    }} else {{
+        canvas = revealCanvases[chartId] = document.createElement('canvas');
+        canvas.height = 200;
+        container.appendChild(canvas);
+    }}
+    ensureChart().then(() => requestAnimationFrame(() => {{
+        if (shownChartId !== chartId) return;
+        const chart = revealCharts[chartId];
+        if (chart) {{
+            chart.reset();
+            chart.update();
+        }} else {{
+            revealCharts[chartId] = renderChart(canvas, chartId);
+        }}
+    }})).catch(err => console.error('Chart.js failed to load:', err));
+}}
+
 function renderChart(canvas, chartId) {{
     const ctx = canvas;
     Chart.defaults.font.family = "'Inter', system-ui, sans-serif";
@@ -1953,26 +2155,72 @@ function hostNextQuestion() {{
     }}
 }}
 
-function showHalftime() {{
-    const sorted = Object.values(players).sort((a, b) => b.score - a.score);
-    const rankIcons = ['gold', 'silver', 'bronze'];
-    let html = '';
-    sorted.forEach((p, i) => {{
-        const rankClass = i < 3 ? rankIcons[i] : '';
-        const rank = i < 3 ? ['1','2','3'][i] : (i + 1);
-        const color = PLAYER_COLORS[p.name] || '#2563eb';
-        html += `<div class="sb-row" style="animation-delay:${{i * 0.1}}s">
-            <div class="sb-rank ${{rankClass}}">${{rank}}</div>
-            <div class="sb-name" style="color:${{color}}">${{p.name}}</div>
-            <div><span class="sb-score">${{p.score}} pts</span><span class="sb-correct">${{p.correct_count}}/${{HALFTIME_AFTER}}</span></div>
-        </div>`;
+// ── Scoreboards ──
+// Built from nodes with textContent so names and picked answers are never
+// parsed as HTML. rows: [{{name, color, score, correct, answers?}}], best first.
+const RANK_CLASSES = ['gold', 'silver', 'bronze'];
+
+function makeEl(tag, className, text) {{
+    const e = document.createElement(tag);
+    if (className) e.className = className;
+    if (text !== undefined) e.textContent = text;
+    return e;
+}}
+
+function renderScoreboard(container, rows, total, opts) {{
+    const frag = document.createDocumentFragment();
+    rows.forEach((p, i) => {{
+        const row = makeEl('div', 'sb-row');
+        row.style.animationDelay = opts.delay(i) + 's';
+        if (opts.hidden) row.style.opacity = '0';
+        if (opts.highlight && p.name === opts.highlight) row.style.border = '2px solid #2563eb';
+        const name = makeEl('div', 'sb-name', p.name);
+        name.style.color = p.color;
+        const score = makeEl('div');
+        score.append(makeEl('span', 'sb-score', p.score + ' pts'),
+                     makeEl('span', 'sb-correct', p.correct + '/' + total));
+        row.append(makeEl('div', 'sb-rank ' + (RANK_CLASSES[i] || ''), String(i + 1)), name, score);
+        frag.appendChild(row);
+
+        if (p.answers) {{
+            // The per-question lines are only built the first time a row is opened
+            const list = makeEl('div', 'sb-answers');
+            list.style.display = 'none';
+            row.style.cursor = 'pointer';
+            row.onclick = () => {{
+                if (!list.firstChild) {{
+                    p.answers.forEach((a, qi) => {{
+                        const icon = makeEl('span', null, a.right ? '✓' : '✗');
+                        icon.style.color = a.right ? '#16a34a' : '#dc2626';
+                        const line = makeEl('div', 'sb-answer');
+                        line.append(icon, ' ', makeEl('span', 'sb-aq', 'Q' + (qi + 1)), ' ' + a.picked);
+                        list.appendChild(line);
+                    }});
+                }}
+                list.style.display = list.style.display === 'none' ? 'block' : 'none';
+            }};
+            frag.appendChild(list);
+        }}
     }});
-    document.getElementById('halftimeScoreboard').innerHTML = html;
+    container.replaceChildren(frag);
+}}
+
+function renderWinnerBanner(rows) {{
+    if (rows.length === 0) return;
+    const winner = makeEl('span', null, rows[0].name);
+    winner.style.color = PLAYER_COLORS.get(rows[0].name) || '#fbbf24';
+    document.getElementById('winnerBanner').replaceChildren(winner, ' vinder!');
+}}
+
+function showHalftime() {{
+    const sorted = [...players.values()].sort((a, b) => b.score - a.score);
+    const scoresArr = sorted.map(p => ({{ name: p.name, color: p.color, score: p.score, correct: p.correct_count }}));
+    renderScoreboard(document.getElementById('halftimeScoreboard'), scoresArr, HALFTIME_AFTER,
+                     {{ delay: i => i * 0.1 }});
     showScreen('screenHalftime');
 
     // Send halftime to players
-    const scoresArr = sorted.map(p => ({{ name: p.name, score: p.score, correct: p.correct_count }}));
-    connections.forEach(c => c.send({{ type: 'halftime', scores: scoresArr }}));
+    broadcast({{ type: 'halftime', scores: scoresArr }});
 }}
 
 function halftimeContinue() {{
@@ -1980,44 +2228,15 @@ function halftimeContinue() {{
 }}
 
 function showFinalScoreboard() {{
-    const sorted = Object.values(players).sort((a, b) => b.score - a.score);
-    const rankIcons = ['gold', 'silver', 'bronze'];
-    const rankEmoji = ['1', '2', '3'];
-
-    // Winner banner
-    if (sorted.length > 0) {{
-        const winner = sorted[0];
-        const winnerColor = PLAYER_COLORS[winner.name] || '#fbbf24';
-        document.getElementById('winnerBanner').innerHTML =
-            `<span style="color:${{winnerColor}}">${{winner.name}}</span> vinder!`;
-    }}
-
-    let html = '';
-    sorted.forEach((p, i) => {{
-        const rankClass = i < 3 ? rankIcons[i] : '';
-        const rank = i < 3 ? rankEmoji[i] : (i + 1);
-        const color = PLAYER_COLORS[p.name] || '#2563eb';
-        const pid = 'answers-' + i;
-        const delay = (sorted.length - 1 - i) * 0.15; // reveal bottom-up: winner appears last
-        html += `<div class="sb-row" onclick="document.getElementById('${{pid}}').style.display=document.getElementById('${{pid}}').style.display==='none'?'block':'none'" style="cursor:pointer;animation-delay:${{delay}}s;opacity:0;">
-            <div class="sb-rank ${{rankClass}}">${{rank}}</div>
-            <div class="sb-name" style="color:${{color}}">${{p.name}}</div>
-            <div><span class="sb-score">${{p.score}} pts</span><span class="sb-correct">${{p.correct_count}}/${{QUESTIONS.length}}</span></div>
-        </div>
-        <div id="${{pid}}" class="sb-answers" style="display:none;">`;
-        if (p.answers) {{
-            p.answers.forEach((a, qi) => {{
-                const icon = a.right ? '<span style="color:#16a34a">&#10003;</span>' : '<span style="color:#dc2626">&#10007;</span>';
-                html += `<div class="sb-answer">${{icon}} <span class="sb-aq">Q${{qi+1}}</span> ${{a.picked}}</div>`;
-            }});
-        }}
-        html += `</div>`;
-    }});
-    document.getElementById('scoreboard').innerHTML = html;
+    const sorted = [...players.values()].sort((a, b) => b.score - a.score);
+    const scoresArr = sorted.map(p => ({{ name: p.name, color: p.color, score: p.score, correct: p.correct_count, answers: p.answers }}));
+    renderWinnerBanner(scoresArr);
+    // Reveal bottom-up: winner appears last
+    renderScoreboard(document.getElementById('scoreboard'), scoresArr, QUESTIONS.length,
+                     {{ delay: i => (sorted.length - 1 - i) * 0.15, hidden: true }});
 
     // Send to players (include answers for their own view)
-    const scoresArr = sorted.map(p => ({{ name: p.name, score: p.score, correct: p.correct_count, answers: p.answers }}));
-    connections.forEach(c => c.send({{ type: 'scoreboard', scores: scoresArr }}));
+    broadcast({{ type: 'scoreboard', scores: scoresArr }});
 
     showScreen('screenScoreboard');
 
@@ -2139,28 +2358,37 @@ function handlePlayerMessage(data, myName) {{
         showScreen('screenPlayerWait');
     }}
     if (data.type === 'question') {{
+        const q = QUESTIONS[data.index];
+        cancelAnswerSend();
+        myQuestion = data.index;
         myAnswer = -1;
         answersLocked = false;
         document.getElementById('playerQNum').textContent = 'Spørgsmål ' + (data.index + 1) + ' af ' + QUESTIONS.length;
-        document.getElementById('playerQText').textContent = data.question;
-        let html = '';
-        data.options.forEach((opt, i) => {{
-            html += `<button class="answer-btn" id="ansBtn${{i}}" onclick="playerAnswer(${{i}})">${{opt}}</button>`;
+        document.getElementById('playerQText').textContent = q.question;
+        const tplBtn = document.getElementById('tplAnsBtn').content.firstElementChild;
+        ansBtnEls = q.options.map((opt, i) => {{
+            const btn = tplBtn.cloneNode(true);
+            btn.id = 'ansBtn' + i;
+            btn.dataset.idx = i;
+            btn.textContent = opt;
+            return btn;
         }});
-        document.getElementById('playerOptions').innerHTML = html;
+        document.getElementById('playerOptions').replaceChildren(...ansBtnEls);
         updateProgress();
         showScreen('screenPlayerQ');
 
         // Start player timer
         const duration = data.timer || TIMER_DURATION;
         startTimer('playerTimerBar', 'playerTimerText', () => {{
+            flushAnswerSend(); // a tap made before time ran out still goes out
             answersLocked = true;
             document.getElementById('playerTimerText').textContent = 'Tid!';
-            document.querySelectorAll('.answer-btn').forEach(b => b.classList.add('locked'));
+            ansBtnEls.forEach(b => b.classList.add('locked'));
         }});
     }}
     if (data.type === 'reveal') {{
         stopTimer();
+        cancelAnswerSend();
         const q = data;
         const wasCorrect = myAnswer === q.correct;
         const fb = document.getElementById('playerFeedback');
@@ -2183,7 +2411,7 @@ function handlePlayerMessage(data, myName) {{
 
         // Show correct answer and earned points
         if (q.correctText) {{
-            detail.innerHTML = 'Svar: <span class="feedback-correct-answer">' + q.correctText + '</span>';
+            detail.replaceChildren('Svar: ', makeEl('span', 'feedback-correct-answer', q.correctText));
         }}
         const earned = q.earned || 0;
         if (earned > 0) {{
@@ -2193,66 +2421,22 @@ function handlePlayerMessage(data, myName) {{
             earnedEl.textContent = '';
         }}
 
-        myScore = q.scores[myName] || 0;
+        myScore = q.score || 0;
         myCorrectCount = wasCorrect ? (myCorrectCount + 1) : myCorrectCount;
         document.getElementById('playerScore').textContent = 'Total: ' + myScore + ' point';
 
         showScreen('screenPlayerFeedback');
     }}
     if (data.type === 'halftime') {{
-        const sorted = data.scores;
-        const rankIcons = ['gold', 'silver', 'bronze'];
-        let html = '';
-        sorted.forEach((p, i) => {{
-            const rankClass = i < 3 ? rankIcons[i] : '';
-            const rank = i < 3 ? ['1','2','3'][i] : (i + 1);
-            const color = PLAYER_COLORS[p.name] || '#2563eb';
-            const highlight = p.name === myName ? 'border:2px solid #2563eb;' : '';
-            html += `<div class="sb-row" style="${{highlight}}animation-delay:${{i * 0.1}}s">
-                <div class="sb-rank ${{rankClass}}">${{rank}}</div>
-                <div class="sb-name" style="color:${{color}}">${{p.name}}</div>
-                <div><span class="sb-score">${{p.score}} pts</span><span class="sb-correct">${{p.correct}}/${{Math.floor(QUESTIONS.length / 2)}}</span></div>
-            </div>`;
-        }});
-        document.getElementById('playerHalftimeScoreboard').innerHTML = html;
+        renderScoreboard(document.getElementById('playerHalftimeScoreboard'), data.scores, HALFTIME_AFTER,
+                         {{ delay: i => i * 0.1, highlight: myName }});
         showScreen('screenPlayerHalftime');
     }}
     if (data.type === 'scoreboard') {{
         const sorted = data.scores;
-        const rankIcons = ['gold', 'silver', 'bronze'];
-        const rankEmoji = ['1', '2', '3'];
-
-        // Winner banner
-        if (sorted.length > 0) {{
-            const winner = sorted[0];
-            const winnerColor = PLAYER_COLORS[winner.name] || '#fbbf24';
-            document.getElementById('winnerBanner').innerHTML =
-                `<span style="color:${{winnerColor}}">${{winner.name}}</span> vinder!`;
-        }}
-
-        let html = '';
-        sorted.forEach((p, i) => {{
-            const rankClass = i < 3 ? rankIcons[i] : '';
-            const rank = i < 3 ? rankEmoji[i] : (i + 1);
-            const color = PLAYER_COLORS[p.name] || '#2563eb';
-            const highlight = p.name === myName ? 'border:2px solid #2563eb;' : '';
-            const pid = 'p-answers-' + i;
-            const delay = (sorted.length - 1 - i) * 0.15;
-            html += `<div class="sb-row" style="${{highlight}}cursor:pointer;animation-delay:${{delay}}s;opacity:0;" onclick="document.getElementById('${{pid}}').style.display=document.getElementById('${{pid}}').style.display==='none'?'block':'none'">
-                <div class="sb-rank ${{rankClass}}">${{rank}}</div>
-                <div class="sb-name" style="color:${{color}}">${{p.name}}</div>
-                <div><span class="sb-score">${{p.score}} pts</span><span class="sb-correct">${{p.correct}}/${{QUESTIONS.length}}</span></div>
-            </div>
-            <div id="${{pid}}" class="sb-answers" style="display:none;">`;
-            if (p.answers) {{
-                p.answers.forEach((a, qi) => {{
-                    const icon = a.right ? '<span style="color:#16a34a">&#10003;</span>' : '<span style="color:#dc2626">&#10007;</span>';
-                    html += `<div class="sb-answer">${{icon}} <span class="sb-aq">Q${{qi+1}}</span> ${{a.picked}}</div>`;
-                }});
-            }}
-            html += `</div>`;
-        }});
-        document.getElementById('scoreboard').innerHTML = html;
+        renderWinnerBanner(sorted);
+        renderScoreboard(document.getElementById('scoreboard'), sorted, QUESTIONS.length,
+                         {{ delay: i => (sorted.length - 1 - i) * 0.15, hidden: true, highlight: myName }});
         showScreen('screenScoreboard');
 
         // Celebration effects
@@ -2264,16 +2448,39 @@ function handlePlayerMessage(data, myName) {{
     }}
 }}
 
+// One listener for every question's answer buttons
+document.getElementById('playerOptions').addEventListener('click', (e) => {{
+    const btn = e.target.closest('.answer-btn');
+    if (btn) playerAnswer(+btn.dataset.idx);
+}});
+
 function playerAnswer(idx) {{
     if (answersLocked) return;
     myAnswer = idx;
 
     // Highlight selected, keep all enabled for changing
-    document.querySelectorAll('.answer-btn').forEach(b => b.classList.remove('selected'));
-    document.getElementById('ansBtn' + idx).classList.add('selected');
+    ansBtnEls.forEach(b => b.classList.remove('selected'));
+    ansBtnEls[idx].classList.add('selected');
+
+    // Send to host (host handles vote changes); taps within one frame
+    // collapse into a single message carrying the latest choice
+    if (answerSendPending) return;
+    answerSendPending = true;
+    answerSendRAF = requestAnimationFrame(flushAnswerSend);
+}}
+
+function flushAnswerSend() {{
+    if (!answerSendPending) return;
+    cancelAnimationFrame(answerSendRAF);
+    answerSendPending = false;
+    if (myAnswer >= 0) hostConn.send([MSG_ANSWER, myQuestion, myAnswer]);
+}}
 
-    // Send to host (host handles vote changes)
-    hostConn.send({{ type: 'answer', option: idx }});
+// A new question or the reveal makes any not-yet-sent answer stale
+function cancelAnswerSend() {{
+    if (!answerSendPending) return;
+    cancelAnimationFrame(answerSendRAF);
+    answerSendPending = false;
 }}
 
 // ── Auto-join from URL param ──
@@ -2290,17 +2497,67 @@ let myName = '';
 </html>"""
 
 
-# ── 6. HTML Assembly ────────────────────────────────────────────────────────
-
-def build_html(chart_data: dict, awards_html: str, stats: pd.DataFrame,
-               weekly: pd.DataFrame, df_bets: pd.DataFrame) -> str:
+def generate_quiz_html(quiz_json: str, chart_data: dict,
+                       stats: pd.DataFrame, weekly: pd.DataFrame,
+                       df_bets: pd.DataFrame,
+                       turn_creds: dict | None = None) -> str:
+    """Build a standalone quiz HTML file with PeerJS for multiplayer."""
     total_weeks = len(weekly)
     total_bets = len(df_bets)
     total_staked = df_bets["Indsats"].sum()
     club_profit = df_bets["Profit"].sum()
-    profit_class = "positive" if club_profit >= 0 else "negative"
+    date_from = df_bets["Dato"].min().strftime("%d/%m/%Y")
+    date_to = df_bets["Dato"].max().strftime("%d/%m/%Y")
+    n_players = df_bets["Spiller"].nunique()
+
+    # Build ICE servers list — Cloudflare TURN + Metered TURN fallback
+    ice_servers = [
+        {"urls": "stun:stun.l.google.com:19302"},
+        {"urls": "stun:stun1.l.google.com:19302"},
+    ]
+    if turn_creds:
+        ice_servers.append(turn_creds)
+    # Metered.ca static TURN fallback
+    metered_user = os.environ.get("METERED_TURN_USERNAME")
+    metered_pass = os.environ.get("METERED_TURN_CREDENTIAL")
+    if metered_user and metered_pass:
+        for url in [
+            "turn:standard.relay.metered.ca:80",
+            "turn:standard.relay.metered.ca:80?transport=tcp",
+            "turn:standard.relay.metered.ca:443",
+            "turns:standard.relay.metered.ca:443?transport=tcp",
+        ]:
+            ice_servers.append(
+                {"urls": url, "username": metered_user, "credential": metered_pass}
+            )
+        print("  Metered TURN servers added as fallback")
+    ice_servers_json = to_json(ice_servers)
+
+    # Quick stats for Q4 reveal
+    quick_stats_json = to_json({
+        "weeks": int(total_weeks),
+        "bets": int(total_bets),
+        "staked": round(total_staked),
+        "profit": round(club_profit),
+    })
+
+    return QUIZ_TEMPLATE.format_map({
+        "date_from": date_from,
+        "date_to": date_to,
+        "n_players": n_players,
+        "total_weeks": total_weeks,
+        "total_bets": total_bets,
+        "quiz_json": quiz_json,
+        "chart_data": chart_data,
+        "quick_stats_json": quick_stats_json,
+        "player_colors_json": to_json(PLAYER_COLORS),
+        "ice_servers_json": ice_servers_json,
+    })
+
+
+# ── 6. HTML Assembly ────────────────────────────────────────────────────────
 
-    return f"""<!DOCTYPE html>
+DASHBOARD_TEMPLATE = """<!DOCTYPE html>
 <html lang="da">
 <head>
 <meta charset="UTF-8">
@@ -2425,30 +2682,47 @@ body {{
         <canvas id="chartBigweeks" height="220"></canvas>
     </div>
 
-    <div class="footer">Tipsklub 2025 &middot; Genereret {datetime.now().strftime('%d/%m/%Y')}</div>
+    <div class="footer">Tipsklub 2025 &middot; Genereret {generated}</div>
 </div>
 
 <script>
 Chart.defaults.font.family = "'Inter', system-ui, sans-serif";
 Chart.defaults.color = '#475569';
+Chart.defaults.scale.grid.color = '#f1f5f9';
+
+// Charts are built when their canvas nears the viewport, so opening the
+// page only pays for the ones on screen
+const chartRenderers = new Map();
+const chartObserver = 'IntersectionObserver' in window
+    ? new IntersectionObserver((entries, observer) => {{
+        for (const entry of entries) {{
+            if (!entry.isIntersecting) continue;
+            observer.unobserve(entry.target);
+            chartRenderers.get(entry.target)();
+        }}
+    }}, {{ rootMargin: '200px' }})
+    : null;
+function whenVisible(id, render) {{
+    if (!chartObserver) return render();
+    const el = document.getElementById(id);
+    chartRenderers.set(el, render);
+    chartObserver.observe(el);
+}}
 
 // ── Chart 1: Cumulative P/L ──
-(function() {{
-    const datasets = {chart_data['cumulative']};
+whenVisible('chartCumulative', () => {{
+    const datasets = {chart_data[cumulative]};
     new Chart(document.getElementById('chartCumulative'), {{
         type: 'line',
         data: {{ datasets }},
         options: {{
-            responsive: true,
             interaction: {{ mode: 'index', intersect: false }},
             scales: {{
                 x: {{
                     type: 'time',
-                    time: {{ unit: 'month', displayFormats: {{ month: 'MMM' }} }},
-                    grid: {{ color: '#f1f5f9' }}
+                    time: {{ unit: 'month', displayFormats: {{ month: 'MMM' }} }}
                 }},
                 y: {{
-                    grid: {{ color: '#f1f5f9' }},
                     ticks: {{ callback: v => v + ' kr' }}
                 }}
             }},
@@ -2461,11 +2735,11 @@ Chart.defaults.color = '#475569';
             }}
         }}
     }});
-}})();
+}});
 
 // ── Chart 2: Leaderboard ──
-(function() {{
-    const d = {chart_data['leaderboard']};
+whenVisible('chartLeaderboard', () => {{
+    const d = {chart_data[leaderboard]};
     new Chart(document.getElementById('chartLeaderboard'), {{
         type: 'bar',
         data: {{
@@ -2474,7 +2748,6 @@ Chart.defaults.color = '#475569';
         }},
         options: {{
             indexAxis: 'y',
-            responsive: true,
             plugins: {{
                 legend: {{ display: false }},
                 tooltip: {{
@@ -2482,16 +2755,16 @@ Chart.defaults.color = '#475569';
                 }}
             }},
             scales: {{
-                x: {{ grid: {{ color: '#f1f5f9' }}, ticks: {{ callback: v => v + ' kr' }} }},
+                x: {{ ticks: {{ callback: v => v + ' kr' }} }},
                 y: {{ grid: {{ display: false }} }}
             }}
         }}
     }});
-}})();
+}});
 
 // ── Chart 3: Win Rate ──
-(function() {{
-    const d = {chart_data['winrate']};
+whenVisible('chartWinrate', () => {{
+    const d = {chart_data[winrate]};
     new Chart(document.getElementById('chartWinrate'), {{
         type: 'bar',
         data: {{
@@ -2499,7 +2772,6 @@ Chart.defaults.color = '#475569';
             datasets: [{{ data: d.data, backgroundColor: d.colors, borderRadius: 4 }}]
         }},
         options: {{
-            responsive: true,
             plugins: {{
                 legend: {{ display: false }},
                 tooltip: {{
@@ -2512,16 +2784,16 @@ Chart.defaults.color = '#475569';
                 }}
             }},
             scales: {{
-                y: {{ max: 100, grid: {{ color: '#f1f5f9' }}, ticks: {{ callback: v => v + '%' }} }},
+                y: {{ max: 100, ticks: {{ callback: v => v + '%' }} }},
                 x: {{ grid: {{ display: false }} }}
             }}
         }}
     }});
-}})();
+}});
 
 // ── Chart 4: Monthly Profit ──
-(function() {{
-    const d = {chart_data['monthly']};
+whenVisible('chartMonthly', () => {{
+    const d = {chart_data[monthly]};
     new Chart(document.getElementById('chartMonthly'), {{
         type: 'bar',
         data: {{
@@ -2529,23 +2801,22 @@ Chart.defaults.color = '#475569';
             datasets: d.datasets.map(ds => ({{ ...ds, borderRadius: 2 }}))
         }},
         options: {{
-            responsive: true,
             plugins: {{
                 tooltip: {{
                     callbacks: {{ label: ctx => ctx.dataset.label + ': ' + ctx.parsed.y.toLocaleString('da-DK') + ' kr' }}
                 }}
             }},
             scales: {{
-                y: {{ grid: {{ color: '#f1f5f9' }}, ticks: {{ callback: v => v + ' kr' }} }},
+                y: {{ ticks: {{ callback: v => v + ' kr' }} }},
                 x: {{ grid: {{ display: false }} }}
             }}
         }}
     }});
-}})();
+}});
 
 // ── Chart 5: Leagues ──
-(function() {{
-    const d = {chart_data['leagues']};
+whenVisible('chartLeagues', () => {{
+    const d = {chart_data[leagues]};
     new Chart(document.getElementById('chartLeagues'), {{
         type: 'bar',
         data: {{
@@ -2554,7 +2825,6 @@ Chart.defaults.color = '#475569';
         }},
         options: {{
             indexAxis: 'y',
-            responsive: true,
             plugins: {{
                 legend: {{ display: false }},
                 tooltip: {{
@@ -2567,79 +2837,81 @@ Chart.defaults.color = '#475569';
                 }}
             }},
             scales: {{
-                x: {{ grid: {{ color: '#f1f5f9' }}, title: {{ display: true, text: 'Antal bets' }} }},
+                x: {{ title: {{ display: true, text: 'Antal bets' }} }},
                 y: {{ grid: {{ display: false }} }}
             }}
         }}
     }});
-}})();
+}});
 
 // ── Chart 6: Odds ──
-(function() {{
-    const d = {chart_data['odds']};
-    const labels = d.map(p => p.player);
-    const avgs = d.map(p => p.avg);
-    const mins = d.map(p => p.min);
-    const maxs = d.map(p => p.max);
-    const colors = d.map(p => p.color);
+whenVisible('chartOdds', () => {{
+    const d = {chart_data[odds]};
+    const labels = [], avgs = [], mins = [], maxDeltas = [], colors = [], minColors = [], maxColors = [];
+    for (const p of d) {{
+        labels.push(p.player);
+        avgs.push(p.avg);
+        mins.push(p.min);
+        maxDeltas.push(p.maxDelta);
+        colors.push(p.color);
+        minColors.push(p.minColor);
+        maxColors.push(p.maxColor);
+    }}
 
     new Chart(document.getElementById('chartOdds'), {{
         type: 'bar',
         data: {{
             labels: labels,
             datasets: [
-                {{ label: 'Min', data: mins, backgroundColor: colors.map(c => c + '33'), borderRadius: 4 }},
+                {{ label: 'Min', data: mins, backgroundColor: minColors, borderRadius: 4 }},
                 {{ label: 'Gns.', data: avgs, backgroundColor: colors, borderRadius: 4 }},
-                {{ label: 'Max', data: maxs.map((mx,i) => mx - avgs[i]),
-                   backgroundColor: colors.map(c => c + '55'), borderRadius: 4 }}
+                {{ label: 'Max', data: maxDeltas,
+                   backgroundColor: maxColors, borderRadius: 4 }}
             ]
         }},
         options: {{
-            responsive: true,
             scales: {{
-                y: {{ grid: {{ color: '#f1f5f9' }}, title: {{ display: true, text: 'Odds' }} }},
+                y: {{ title: {{ display: true, text: 'Odds' }} }},
                 x: {{ grid: {{ display: false }}, stacked: false }}
             }},
             plugins: {{
                 tooltip: {{
                     callbacks: {{
                         label: ctx => {{
-                            const idx = ctx.dataIndex;
-                            return `${{d[idx].player}}: min ${{d[idx].min}}, gns. ${{d[idx].avg}}, max ${{d[idx].max}}`;
+                            const p = d[ctx.dataIndex];
+                            return `${{p.player}}: min ${{p.min}}, gns. ${{p.avg}}, max ${{p.max}}`;
                         }}
                     }}
                 }}
             }}
         }}
     }});
-}})();
+}});
 
 // ── Chart 7: Weekday Heatmap (HTML) ──
 (function() {{
-    const d = {chart_data['weekday']};
-    const maxVal = Math.max(...d.data.map(c => c.v));
-    let html = '<div class="heatmap">';
-    html += '<div></div>';
-    d.days.forEach(day => {{ html += '<div class="hm-header">' + day + '</div>'; }});
+    const d = {chart_data[weekday]};
+    const maxVal = d.max;
+    const parts = ['<div class="heatmap">', '<div></div>'];
+    d.days.forEach(day => {{ parts.push('<div class="hm-header">' + day + '</div>'); }});
     d.players.forEach((player, pi) => {{
-        html += '<div class="hm-label">' + player + '</div>';
+        parts.push('<div class="hm-label">' + player + '</div>');
         for (let di = 0; di < 7; di++) {{
-            const cell = d.data.find(c => c.x === di && c.y === pi);
-            const v = cell ? cell.v : 0;
+            const v = d.matrix[pi][di];
             const intensity = maxVal > 0 ? v / maxVal : 0;
             const bg = v === 0 ? '#f8fafc'
                 : `rgba(37, 99, 235, ${{0.12 + intensity * 0.68}})`;
             const fg = intensity > 0.5 ? '#fff' : '#1e293b';
-            html += `<div class="hm-cell" style="background:${{bg}};color:${{fg}}">${{v || ''}}</div>`;
+            parts.push(`<div class="hm-cell" style="background:${{bg}};color:${{fg}}">${{v || ''}}</div>`);
         }}
     }});
-    html += '</div>';
-    document.getElementById('heatmapContainer').innerHTML = html;
+    parts.push('</div>');
+    document.getElementById('heatmapContainer').innerHTML = parts.join('');
 }})();
 
 // ── Chart 8: Best & Worst Weeks ──
-(function() {{
-    const d = {chart_data['bigweeks']};
+whenVisible('chartBigweeks', () => {{
+    const d = {chart_data[bigweeks]};
     new Chart(document.getElementById('chartBigweeks'), {{
         type: 'bar',
         data: {{
@@ -2648,7 +2920,6 @@ Chart.defaults.color = '#475569';
         }},
         options: {{
             indexAxis: 'y',
-            responsive: true,
             plugins: {{
                 legend: {{ display: false }},
                 tooltip: {{
@@ -2656,79 +2927,132 @@ Chart.defaults.color = '#475569';
                 }}
             }},
             scales: {{
-                x: {{ grid: {{ color: '#f1f5f9' }}, ticks: {{ callback: v => v + ' kr' }} }},
+                x: {{ ticks: {{ callback: v => v + ' kr' }} }},
                 y: {{ grid: {{ display: false }} }}
             }}
         }}
     }});
-}})();
+}});
 </script>
 </body>
 </html>"""
 
 
-# ── Main ────────────────────────────────────────────────────────────────────
+def build_html(chart_data: dict, awards_html: str, stats: pd.DataFrame,
+               weekly: pd.DataFrame, df_bets: pd.DataFrame) -> str:
+    total_weeks = len(weekly)
+    total_bets = len(df_bets)
+    total_staked = df_bets["Indsats"].sum()
+    club_profit = df_bets["Profit"].sum()
+    profit_class = "positive" if club_profit >= 0 else "negative"
 
-def main():
-    df_bets = fetch_data()
-    weekly = aggregate_weekly(df_bets)
-    stats = compute_player_stats(weekly, df_bets)
-
-    print("\n── 2025 Player Stats (weekly) ──")
-    for _, row in stats.iterrows():
-        print(
-            f"  {row['Spiller']:10s}  "
-            f"Weeks: {row['Weeks']:2.0f}  "
-            f"W/L: {row['Winning Weeks']:.0f}/{row['Losing Weeks']:.0f}  "
-            f"Profit: {row['Total Profit']:+8,.0f} kr  "
-            f"WR: {row['Win Rate']:4.1f}%  "
-            f"ROI: {row['ROI']:+.1f}%  "
-            f"Streak: W{row['Win Streak']:.0f}/L{row['Loss Streak']:.0f}"
-        )
+    return DASHBOARD_TEMPLATE.format_map({
+        "total_weeks": total_weeks,
+        "total_bets": total_bets,
+        "total_staked": total_staked,
+        "club_profit": club_profit,
+        "profit_class": profit_class,
+        "awards_html": awards_html,
+        "chart_data": chart_data,
+        "generated": datetime.now().strftime("%d/%m/%Y"),
+    })
 
-    print("\nGenerating charts...")
-    chart_data = {
-        "cumulative": chart1_cumulative_data(weekly),
-        "leaderboard": chart2_leaderboard_data(stats),
-        "winrate": chart3_winrate_data(stats),
-        "monthly": chart4_monthly_data(weekly),
-        "leagues": chart5_league_data(df_bets),
-        "odds": chart6_odds_data(df_bets),
-        "weekday": chart7_weekday_data(df_bets),
-        "bigweeks": chart8_best_worst_data(weekly),
-        "bestWeeks": chart_best_weeks_only(weekly),
-        "worstWeeks": chart_worst_weeks_only(weekly),
-        "cumulativeClub": chart_cumulative_club(weekly),
-        "weekdayTotal": chart_weekday_totals(df_bets),
-        "betsPerPlayer": chart_bets_per_player(stats),
-        "highOddsPerPlayer": chart_high_odds_per_player(df_bets),
-        "lossesPerPlayer": chart_losses_per_player(stats),
-        "closerRate": chart_closer_rate(df_bets),
-        "bestWinningOdds": chart_best_winning_odds(df_bets),
-    }
 
-    print("Generating award cards...")
-    awards_html = generate_award_cards(stats, weekly)
+# ── Main ────────────────────────────────────────────────────────────────────
 
-    print("Assembling HTML...")
-    html = build_html(chart_data, awards_html, stats, weekly, df_bets)
+def write_page(path: str, html: str) -> str:
+    """Write a generated page and return its size for the console summary.
 
-    output_path = "tipsklub_2025.html"
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(html)
+    Set TIPSKLUB_GZIP=1 to also write a pre-compressed .gz sibling.
+    """
+    # Encode once; the bytes are written as-is and reused for the .gz copy
+    data = html.encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(data)
+    size = f"{len(data) / 1024:.0f} KB"
+    if os.environ.get("TIPSKLUB_GZIP"):
+        packed = gzip.compress(data, compresslevel=6)
+        with open(path + ".gz", "wb") as f:
+            f.write(packed)
+        size += f", {len(packed) / 1024:.0f} KB gzipped"
+    return size
 
-    print(f"  Dashboard: {output_path} ({len(html) / 1024:.0f} KB)")
 
-    print("Generating quiz...")
-    turn_creds = fetch_turn_credentials()
-    quiz_json = generate_quiz_questions(stats, weekly, df_bets, chart_data)
+def main():
+    # TURN credentials are only needed for the quiz, so request them in the
+    # background while the sheet is downloaded and processed.
+    with ThreadPoolExecutor(max_workers=2) as background:
+        turn_future = background.submit(fetch_turn_credentials)
+
+        df_bets = fetch_data()
+        weekly = aggregate_weekly(df_bets)
+        stats = compute_player_stats(weekly, df_bets)
+        bet_metrics = compute_bet_metrics(df_bets)
+        league_stats = compute_league_stats(df_bets)
+
+        print("\n── 2025 Player Stats (weekly) ──")
+        stat_line = (
+            "  {:10s}  "
+            "Weeks: {:2.0f}  "
+            "W/L: {:.0f}/{:.0f}  "
+            "Profit: {:+8,.0f} kr  "
+            "WR: {:4.1f}%  "
+            "ROI: {:+.1f}%  "
+            "Streak: W{:.0f}/L{:.0f}"
+        )
+        stat_cols = ["Spiller", "Weeks", "Winning Weeks", "Losing Weeks", "Total Profit",
+                     "Win Rate", "ROI", "Win Streak", "Loss Streak"]
+        print("\n".join(stat_line.format(*row)
+                        for row in stats[stat_cols].itertuples(index=False, name=None)))
+
+        print("\nGenerating charts...")
+        # The builders are independent read-only passes over the frames, so run
+        # them on a thread pool; most of their time is spent inside pandas.
+        builders = {
+            "cumulative": (chart1_cumulative_data, weekly),
+            "leaderboard": (chart2_leaderboard_data, stats),
+            "winrate": (chart3_winrate_data, stats),
+            "monthly": (chart4_monthly_data, weekly),
+            "leagues": (chart5_league_data, league_stats),
+            "odds": (chart6_odds_data, df_bets),
+            "weekday": (chart7_weekday_data, df_bets),
+            "bigweeks": (chart8_best_worst_data, weekly),
+            "bestWeeks": (chart_best_weeks_only, weekly),
+            "worstWeeks": (chart_worst_weeks_only, weekly),
+            "cumulativeClub": (chart_cumulative_club, weekly),
+            "weekdayTotal": (chart_weekday_totals, df_bets),
+            "betsPerPlayer": (chart_bets_per_player, stats),
+            "highOddsPerPlayer": (chart_high_odds_per_player, bet_metrics),
+            "lossesPerPlayer": (chart_losses_per_player, stats),
+            "closerRate": (chart_closer_rate, bet_metrics),
+            "bestWinningOdds": (chart_best_winning_odds, bet_metrics),
+        }
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = {name: pool.submit(fn, frame) for name, (fn, frame) in builders.items()}
+            chart_data = {name: future.result() for name, future in futures.items()}
+
+        print("Generating award cards...")
+        picks = compute_picks(stats, weekly)
+        # The quiz questions only read the computed frames, so build them while
+        # the dashboard is assembled and written.
+        quiz_future = background.submit(
+            generate_quiz_questions, picks, stats, weekly, df_bets, bet_metrics, league_stats,
+            chart_data)
+        awards_html = generate_award_cards(picks)
+
+        print("Assembling HTML...")
+        html = build_html(chart_data, awards_html, stats, weekly, df_bets)
+
+        output_path = "tipsklub_2025.html"
+        print(f"  Dashboard: {output_path} ({write_page(output_path, html)})")
+
+        print("Generating quiz...")
+        turn_creds = turn_future.result()
+        quiz_json = quiz_future.result()
     quiz_html = generate_quiz_html(quiz_json, chart_data, stats, weekly, df_bets, turn_creds)
 
     quiz_path = "tipsklub_quiz.html"
-    with open(quiz_path, "w", encoding="utf-8") as f:
-        f.write(quiz_html)
-
-    print(f"  Quiz: {quiz_path} ({len(quiz_html) / 1024:.0f} KB)")
+    print(f"  Quiz: {quiz_path} ({write_page(quiz_path, quiz_html)})")
     print("\nDone!")
 
 